@@ -5,8 +5,9 @@ UPDATED: Added per-sheet SEQ mapping exports (SEQ_MHR_MAPPINGS, SEQ_NEWTASK_MAPP
 """
 
 from .config import *
-from .data_loader import load_input_files, load_reference_ids
-from .id_extractor import extract_task_id, extract_id_from_title
+from .data_loader import load_input_files, iter_input_files, load_reference_ids
+from .id_extractor import (extract_task_id, extract_task_id_from_values, extract_task_ids,
+                           extract_id_from_title, lookup_seq_mapping)
 from .data_processor import process_data
 
 __all__ = [
@@ -57,16 +58,21 @@ __all__ = [
     'get_seq_coefficient',
     'should_process_for_sheet',
     'print_config',
+    'format_config',
     'SKIP_COEFFICIENT_CODES',
     'ARRAY_SKIP_COEFFICIENT',
 
     # Data loader exports
     'load_input_files',
+    'iter_input_files',
     'load_reference_ids',
 
     # ID extractor exports
     'extract_task_id',
+    'extract_task_id_from_values',
+    'extract_task_ids',
     'extract_id_from_title',
+    'lookup_seq_mapping',
 
     # Data processor exports
     'process_data',
@@ -6,6 +6,7 @@ UPDATED: Added per-sheet SEQ mapping overrides (SEQ_MHR_Mappings, SEQ_NewTask_Ma
 
 import configparser
 import os
+from functools import lru_cache
 import pandas as pd
 
 # Load the configuration settings from settings.ini
@@ -197,50 +198,66 @@ def should_process_for_sheet(seq_no, sheet_mapping):
     return value != 'ignore'
 
 
+@lru_cache(maxsize=1)
+def format_config():
+    """
+    Render the configuration as text (for debugging purposes).
+
+    Settings are fixed once this module is imported, so the text is built
+    once and reused.
+
+    Returns:
+        str: One "Name: value" line per setting
+    """
+    lines = []
+    lines.append(f"Input folder: {INPUT_FOLDER}")
+    lines.append(f"Output folder: {OUTPUT_FOLDER}")
+    lines.append(f"Reference file: {REFERENCE_FILE}")
+    lines.append(f"Reference folder: {REFERENCE_FOLDER}")
+    lines.append(f"Reference Task Sheet Name: {REFERENCE_TASK_SHEET_NAME}")
+    lines.append(f"Reference Task ID Column: {REFERENCE_TASK_ID_COLUMN}")
+    lines.append(f"Reference EO Sheet Name: {REFERENCE_EO_SHEET_NAME}")
+    lines.append(f"Reference EO ID Column: {REFERENCE_EO_ID_COLUMN}")
+    lines.append(f"EO Prefix: {REFERENCE_EO_PREFIX}")
+    lines.append(f"Bonus Hours File: {BONUS_HOURS_FILE}")
+    lines.append(f"Aircraft Code Column: {AIRCRAFT_CODE_COLUMN}")
+    lines.append(f"Product Code Column: {PRODUCT_CODE_COLUMN}")
+    lines.append(f"Bonus Column 1: {BONUS_1_COLUMN}")
+    lines.append(f"Bonus Column 2: {BONUS_2_COLUMN}")
+    lines.append(f"Bonus IsActive Column: {BONUS_ISACTIVE_COLUMN}")
+    lines.append(f"Aircraft Type File: {AC_TYPE_FILE}")
+    lines.append(f"Aircraft Registration Column: {AC_TYPE_REGISTRATION_COLUMN}")
+    lines.append(f"Aircraft Type Column: {AC_TYPE_TYPE_COLUMN}")
+    lines.append(f"Seq. No. Column: {SEQ_NO_COLUMN}")
+    lines.append(f"Title Column: {TITLE_COLUMN}")
+    lines.append(f"Planned Mhrs Column: {PLANNED_MHRS_COLUMN}")
+    lines.append(f"Special Code Column: {SPECIAL_CODE_COLUMN}")
+    lines.append(f"A Column: {A_COLUMN}")
+    lines.append(f"Enable Special Code: {ENABLE_SPECIAL_CODE}")
+    lines.append(f"Enable Tool Control: {ENABLE_TOOL_CONTROL}")
+    if ENABLE_TOOL_CONTROL:
+        lines.append(f"Tool Name Column: {TOOL_NAME_COLUMN}")
+        lines.append(f"Tool Type Column: {TOOL_TYPE_COLUMN}")
+        lines.append(f"Tool Part No Column: {TOOL_PARTNO_COLUMN}")
+        lines.append(f"Total Qty Column: {TOTAL_QTY_COLUMN}")
+        lines.append(f"Alt Qty Column: {ALT_QTY_COLUMN}")
+        lines.append(f"Tool Percentage Column: {TOOL_PERCENTAGE_COLUMN}")
+    lines.append(f"High Mhrs Threshold: {HIGH_MHRS_HOURS}")
+    lines.append(f"Random Sample Size: {RANDOM_SAMPLE_SIZE}")
+    lines.append(f"Hours per Shift: {HOURS_PER_SHIFT}")
+    lines.append(f"Show Bonus Hours Breakdown: {SHOW_BONUS_HOURS_BREAKDOWN}")
+    lines.append(f"Base SEQ Mappings: {SEQ_MAPPINGS}")
+    lines.append(f"MHR SEQ Mappings (effective): {SEQ_MHR_MAPPINGS}")
+    lines.append(f"New Task SEQ Mappings (effective): {SEQ_NEWTASK_MAPPINGS}")
+    lines.append(f"Tool Control SEQ Mappings (effective): {SEQ_TOOL_MAPPINGS}")
+    lines.append(f"SEQ ID Mappings: {SEQ_ID_MAPPINGS}")
+    lines.append(f"Skip Coefficient Codes: {SKIP_COEFFICIENT_CODES}")
+    lines.append(f"SEQ Coefficients: {SEQ_COEFFICIENTS}")
+    lines.append(f"Array Skip Coefficient: {ARRAY_SKIP_COEFFICIENT}")
+    lines.append(f"Default Coefficient: {DEFAULT_COEFFICIENT}")
+    return "\n".join(lines)
+
+
 def print_config():
     """Display the configuration (for debugging purposes)."""
-    print(f"Input folder: {INPUT_FOLDER}")
-    print(f"Output folder: {OUTPUT_FOLDER}")
-    print(f"Reference file: {REFERENCE_FILE}")
-    print(f"Reference folder: {REFERENCE_FOLDER}")
-    print(f"Reference Task Sheet Name: {REFERENCE_TASK_SHEET_NAME}")
-    print(f"Reference Task ID Column: {REFERENCE_TASK_ID_COLUMN}")
-    print(f"Reference EO Sheet Name: {REFERENCE_EO_SHEET_NAME}")
-    print(f"Reference EO ID Column: {REFERENCE_EO_ID_COLUMN}")
-    print(f"EO Prefix: {REFERENCE_EO_PREFIX}")
-    print(f"Bonus Hours File: {BONUS_HOURS_FILE}")
-    print(f"Aircraft Code Column: {AIRCRAFT_CODE_COLUMN}")
-    print(f"Product Code Column: {PRODUCT_CODE_COLUMN}")
-    print(f"Bonus Column 1: {BONUS_1_COLUMN}")
-    print(f"Bonus Column 2: {BONUS_2_COLUMN}")
-    print(f"Bonus IsActive Column: {BONUS_ISACTIVE_COLUMN}")
-    print(f"Aircraft Type File: {AC_TYPE_FILE}")
-    print(f"Aircraft Registration Column: {AC_TYPE_REGISTRATION_COLUMN}")
-    print(f"Aircraft Type Column: {AC_TYPE_TYPE_COLUMN}")
-    print(f"Seq. No. Column: {SEQ_NO_COLUMN}")
-    print(f"Title Column: {TITLE_COLUMN}")
-    print(f"Planned Mhrs Column: {PLANNED_MHRS_COLUMN}")
-    print(f"Special Code Column: {SPECIAL_CODE_COLUMN}")
-    print(f"A Column: {A_COLUMN}")
-    print(f"Enable Special Code: {ENABLE_SPECIAL_CODE}")
-    print(f"Enable Tool Control: {ENABLE_TOOL_CONTROL}")
-    if ENABLE_TOOL_CONTROL:
-        print(f"Tool Name Column: {TOOL_NAME_COLUMN}")
-        print(f"Tool Type Column: {TOOL_TYPE_COLUMN}")
-        print(f"Tool Part No Column: {TOOL_PARTNO_COLUMN}")
-        print(f"Total Qty Column: {TOTAL_QTY_COLUMN}")
-        print(f"Alt Qty Column: {ALT_QTY_COLUMN}")
-        print(f"Tool Percentage Column: {TOOL_PERCENTAGE_COLUMN}")
-    print(f"High Mhrs Threshold: {HIGH_MHRS_HOURS}")
-    print(f"Random Sample Size: {RANDOM_SAMPLE_SIZE}")
-    print(f"Hours per Shift: {HOURS_PER_SHIFT}")
-    print(f"Show Bonus Hours Breakdown: {SHOW_BONUS_HOURS_BREAKDOWN}")
-    print(f"Base SEQ Mappings: {SEQ_MAPPINGS}")
-    print(f"MHR SEQ Mappings (effective): {SEQ_MHR_MAPPINGS}")
-    print(f"New Task SEQ Mappings (effective): {SEQ_NEWTASK_MAPPINGS}")
-    print(f"Tool Control SEQ Mappings (effective): {SEQ_TOOL_MAPPINGS}")
-    print(f"SEQ ID Mappings: {SEQ_ID_MAPPINGS}")
-    print(f"Skip Coefficient Codes: {SKIP_COEFFICIENT_CODES}")
-    print(f"SEQ Coefficients: {SEQ_COEFFICIENTS}")
-    print(f"Array Skip Coefficient: {ARRAY_SKIP_COEFFICIENT}")
-    print(f"Default Coefficient: {DEFAULT_COEFFICIENT}")
\ No newline at end of file
+    print(format_config())
@@ -5,9 +5,10 @@ REFACTORED: Now uses centralized logging system
 """
 
 import os
-import glob
+import json
 import pandas as pd
-from utils.logger import get_logger
+from utils.logger import get_logger, log_root
+from utils.excel_utils import read_excel_fast, EXCEL_READ_ENGINE
 from core.config import (INPUT_FOLDER, REFERENCE_FOLDER, REFERENCE_FILE,
                      REFERENCE_TASK_SHEET_NAME, REFERENCE_TASK_ID_COLUMN,
                      REFERENCE_EO_SHEET_NAME, REFERENCE_EO_ID_COLUMN)
@@ -16,6 +17,32 @@ from core.config import (INPUT_FOLDER, REFERENCE_FOLDER, REFERENCE_FILE,
 logger = get_logger(module_name="data_loader")
 
 
+def iter_input_files(input_folder=INPUT_FOLDER):
+    """
+    Yield the Excel files in the input folder.
+
+    Uses a single os.scandir pass. Hidden files and the '~$' lock files
+    Excel leaves next to open workbooks are skipped, since they cannot
+    be parsed.
+
+    Args:
+        input_folder (str): Folder to scan (default: INPUT_FOLDER)
+
+    Yields:
+        str: Path to each input Excel file
+    """
+    try:
+        with os.scandir(input_folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.lower().endswith('.xlsx')
+                        and not name.startswith(('~$', '.'))
+                        and entry.is_file()):
+                    yield entry.path
+    except FileNotFoundError:
+        return
+
+
 def load_input_files():
     """
     Load all Excel files from the input folder.
@@ -23,7 +50,7 @@ def load_input_files():
     Returns:
         list: List of paths to input Excel files
     """
-    input_files = glob.glob(os.path.join(INPUT_FOLDER, "*.xlsx"))
+    input_files = list(iter_input_files())
 
     if not input_files:
         logger.warning(f"No .xlsx files found in the '{INPUT_FOLDER}' folder.")
@@ -37,51 +64,169 @@ def load_reference_ids():
     """
     Load reference IDs from both Task and EO sheets.
 
+    The ID sets are built once here and shared read-only by every input file,
+    so they are frozen to make that explicit. They are also cached as JSON
+    under LOG/cache, so later runs skip parsing the workbook until it changes.
+
     Returns:
-        dict: Dictionary with keys 'task_ids' and 'eo_ids', each containing a set of IDs
+        dict: Dictionary with keys 'task_ids' and 'eo_ids', each containing a frozenset of IDs
     """
     # Construct path to reference file
     reference_file_path = os.path.join(REFERENCE_FOLDER, REFERENCE_FILE)
 
-    # Initialize result dictionary
-    result = {
-        'task_ids': set(),
-        'eo_ids': set()
-    }
+    cache_key = _reference_cache_key(reference_file_path)
+    if cache_key is not None:
+        cached = _read_reference_cache(cache_key)
+        if cached is not None:
+            logger.info(f"Loaded {len(cached['task_ids'])} Task IDs and "
+                        f"{len(cached['eo_ids'])} EO IDs from reference cache")
+            return cached
+
+    result, complete = _load_reference_ids_from_workbook(reference_file_path)
+
+    # Only cache a clean load, so a broken sheet is retried next run
+    if cache_key is not None and complete:
+        _write_reference_cache(cache_key, result)
+
+    return result
+
+
+def _reference_cache_key(reference_file_path):
+    """
+    Everything that decides which IDs are read: the workbook version, the
+    read engine and the sheet/column settings. A cache built with another
+    key is stale.
 
-    # Load Task IDs from the Task sheet
+    Returns:
+        list or None: Cache key, or None if the reference file does not exist
+    """
     try:
-        task_df = pd.read_excel(reference_file_path, engine='openpyxl', sheet_name=REFERENCE_TASK_SHEET_NAME)
+        stat = os.stat(reference_file_path)
+    except OSError:
+        return None
 
-        # Check if the column exists
-        if REFERENCE_TASK_ID_COLUMN not in task_df.columns:
-            logger.warning(f"Column '{REFERENCE_TASK_ID_COLUMN}' not found in '{REFERENCE_TASK_SHEET_NAME}' sheet.")
-            logger.debug(f"Available columns: {list(task_df.columns)}")
-        else:
-            task_ids = task_df[REFERENCE_TASK_ID_COLUMN].dropna().apply(str).unique()
-            result['task_ids'] = set(task_ids)
-            logger.info(f"Loaded {len(result['task_ids'])} Task IDs from '{REFERENCE_TASK_SHEET_NAME}' sheet")
+    return [os.path.abspath(reference_file_path), stat.st_mtime_ns, stat.st_size,
+            EXCEL_READ_ENGINE, REFERENCE_TASK_SHEET_NAME, REFERENCE_TASK_ID_COLUMN,
+            REFERENCE_EO_SHEET_NAME, REFERENCE_EO_ID_COLUMN]
+
+
+def _reference_cache_path():
+    """Path of the reference IDs cache, under LOG/cache rather than the user's data folder."""
+    return log_root() / 'cache' / 'reference_ids.json'
 
-    except Exception as e:
-        logger.error(f"Error loading Task sheet: {e}")
 
-    # Load EO IDs from the EO sheet
+def _read_reference_cache(cache_key):
+    """Return the cached reference IDs, or None if missing, unreadable or stale."""
+    cache_path = _reference_cache_path()
     try:
-        eo_df = pd.read_excel(reference_file_path, engine='openpyxl', sheet_name=REFERENCE_EO_SHEET_NAME)
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['key'] != cache_key:
+            return None
+        return {'task_ids': frozenset(map(str, cached['task_ids'])),
+                'eo_ids': frozenset(map(str, cached['eo_ids']))}
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug(f"Ignoring unreadable reference cache {cache_path}: {e}")
+        return None
+
+
+def _write_reference_cache(cache_key, result):
+    """Write the reference IDs cache as plain JSON lists, replacing any older one."""
+    cache_path = _reference_cache_path()
+
+    # Write to a temp file first so a crash never leaves a truncated cache
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': cache_key,
+                       'task_ids': sorted(result['task_ids']),
+                       'eo_ids': sorted(result['eo_ids'])}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not write reference cache {cache_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _unique_id_set(id_column):
+    """
+    Build the frozenset of distinct IDs in a reference column.
 
-        # Check if the column exists
-        if REFERENCE_EO_ID_COLUMN not in eo_df.columns:
-            logger.warning(f"Column '{REFERENCE_EO_ID_COLUMN}' not found in '{REFERENCE_EO_SHEET_NAME}' sheet.")
-            logger.debug(f"Available columns: {list(eo_df.columns)}")
-        else:
-            eo_ids = eo_df[REFERENCE_EO_ID_COLUMN].dropna().apply(str).unique()
-            result['eo_ids'] = set(eo_ids)
-            logger.info(f"Loaded {len(result['eo_ids'])} EO IDs from '{REFERENCE_EO_SHEET_NAME}' sheet")
+    Values are converted with a single astype(str) and deduplicated with the
+    hash-based unique() before any Python set is built, so repeated IDs are
+    only materialized once.
+    """
+    return frozenset(id_column.dropna().astype(str).unique())
 
-    except Exception as e:
-        logger.error(f"Error loading EO sheet: {e}")
 
-    return result
+def _load_reference_ids_from_workbook(reference_file_path):
+    """
+    Parse the Task and EO reference IDs from the reference workbook.
+
+    Returns:
+        tuple: (result dict as returned by load_reference_ids, True if both sheets loaded cleanly)
+    """
+    # Initialize result dictionary
+    result = {
+        'task_ids': frozenset(),
+        'eo_ids': frozenset()
+    }
+    complete = False
+
+    # Open the workbook once and parse both sheets from the same handle
+    try:
+        reference_xl = pd.ExcelFile(reference_file_path, engine=EXCEL_READ_ENGINE)
+    except Exception as e:
+        logger.error(f"Error opening reference file: {e}")
+        return result, complete
+
+    with reference_xl:
+        task_loaded = eo_loaded = False
+
+        # Load Task IDs from the Task sheet
+        try:
+            # Only the ID column is used, so skip converting the rest
+            task_df = reference_xl.parse(REFERENCE_TASK_SHEET_NAME,
+                                         usecols=lambda c: c == REFERENCE_TASK_ID_COLUMN)
+
+            # Check if the column exists
+            if REFERENCE_TASK_ID_COLUMN not in task_df.columns:
+                logger.warning(f"Column '{REFERENCE_TASK_ID_COLUMN}' not found in '{REFERENCE_TASK_SHEET_NAME}' sheet.")
+                available = reference_xl.parse(REFERENCE_TASK_SHEET_NAME, nrows=0).columns
+                logger.debug(f"Available columns: {list(available)}")
+            else:
+                result['task_ids'] = _unique_id_set(task_df[REFERENCE_TASK_ID_COLUMN])
+                logger.info(f"Loaded {len(result['task_ids'])} Task IDs from '{REFERENCE_TASK_SHEET_NAME}' sheet")
+                task_loaded = True
+
+        except Exception as e:
+            logger.error(f"Error loading Task sheet: {e}")
+
+        # Load EO IDs from the EO sheet
+        try:
+            # Only the ID column is used, so skip converting the rest
+            eo_df = reference_xl.parse(REFERENCE_EO_SHEET_NAME,
+                                       usecols=lambda c: c == REFERENCE_EO_ID_COLUMN)
+
+            # Check if the column exists
+            if REFERENCE_EO_ID_COLUMN not in eo_df.columns:
+                logger.warning(f"Column '{REFERENCE_EO_ID_COLUMN}' not found in '{REFERENCE_EO_SHEET_NAME}' sheet.")
+                available = reference_xl.parse(REFERENCE_EO_SHEET_NAME, nrows=0).columns
+                logger.debug(f"Available columns: {list(available)}")
+            else:
+                result['eo_ids'] = _unique_id_set(eo_df[REFERENCE_EO_ID_COLUMN])
+                logger.info(f"Loaded {len(result['eo_ids'])} EO IDs from '{REFERENCE_EO_SHEET_NAME}' sheet")
+                eo_loaded = True
+
+        except Exception as e:
+            logger.error(f"Error loading EO sheet: {e}")
+
+        complete = task_loaded and eo_loaded
+
+    return result, complete
 
 
 def load_input_dataframe(file_path):
@@ -98,7 +243,7 @@ def load_input_dataframe(file_path):
         Exception: If file cannot be loaded
     """
     try:
-        df = pd.read_excel(file_path, engine='openpyxl')
+        df = read_excel_fast(file_path)
         logger.info(f"Loaded {len(df)} rows from {os.path.basename(file_path)}")
         return df
     except Exception as e:
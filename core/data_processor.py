@@ -8,7 +8,6 @@ UPDATED: New Task ID detection now carries the TITLE_COLUMN (Description) forwar
 """
 
 import os
-from datetime import datetime
 
 import pandas as pd
 
@@ -23,7 +22,6 @@ from core.config import (
     SPECIAL_CODE_COLUMN,
     TITLE_COLUMN,
     get_seq_coefficient,
-    should_process_for_sheet,
     SKIP_COEFFICIENT_CODES,
     ARRAY_SKIP_COEFFICIENT,
     # Per-sheet mappings
@@ -34,7 +32,7 @@ from core.config import (
     SEQ_ID_MAPPINGS,
 )
 from core.data_loader import extract_workpack_dates, load_input_dataframe
-from core.id_extractor import extract_task_id
+from core.id_extractor import extract_task_ids, get_seq_prefixes, lookup_seq_mapping
 from features.a_extractor import (
     extract_from_dataframe,
     get_bonus_breakdown_by_source,
@@ -46,8 +44,8 @@ from features.special_code import (
     calculate_special_code_per_day,
     validate_special_code_column,
 )
-from utils.logger import WorkpackLogger, get_logger
-from utils.time_utils import convert_planned_mhrs, hours_to_hhmm
+from utils.logger import get_logger, get_workpack_logger
+from utils.time_utils import convert_planned_mhrs_series, hours_to_hhmm, hours_to_hhmm_series, now_str
 from utils.validation import validate_required_columns
 
 # Import tool control module if enabled
@@ -106,8 +104,12 @@ def filter_df_for_sheet(df, sheet_mapping, label):
         pd.DataFrame: filtered copy with a clean integer index
     """
     logger = get_logger(module_name="data_processor")
-    mask = df[SEQ_NO_COLUMN].apply(lambda s: should_process_for_sheet(s, sheet_mapping))
-    filtered = df[mask].copy().reset_index(drop=True)
+    # Vectorized should_process_for_sheet(): blank SEQs are always excluded
+    seq_values = df[SEQ_NO_COLUMN]
+    mask = seq_values.notna() & (
+        lookup_seq_mapping(get_seq_prefixes(seq_values), sheet_mapping) != 'ignore'
+    )
+    filtered = df[mask].reset_index(drop=True)
     excluded = len(df) - len(filtered)
     if excluded:
         logger.info(f"[{label}] Excluded {excluded} row(s) based on per-sheet SEQ mapping")
@@ -120,7 +122,7 @@ def process_data(input_file_path, reference_data):
 
     Args:
         input_file_path (str): Path to the input Excel file
-        reference_data (dict): Dictionary containing 'task_ids' and 'eo_ids' sets
+        reference_data (dict): Dictionary containing 'task_ids' and 'eo_ids' frozensets
 
     Returns:
         dict: Dictionary with structured data for Excel output
@@ -132,7 +134,7 @@ def process_data(input_file_path, reference_data):
     logger.info("STARTING DATA PROCESSING")
     logger.info("="*80)
     logger.info(f"File: {input_file_path}")
-    logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"Timestamp: {now_str()}")
     logger.info("")
 
     # Load file
@@ -186,10 +188,11 @@ def process_data(input_file_path, reference_data):
             input_file_path,
             SEQ_TOOL_MAPPINGS,   # <-- per-sheet mapping passed to tool control
             SEQ_ID_MAPPINGS,
+            df=df,               # reuse the already-parsed input workbook
         )
 
     # Convert planned Mhrs (minutes) → hours
-    df['Base Hours'] = df[PLANNED_MHRS_COLUMN].apply(convert_planned_mhrs)
+    df['Base Hours'] = convert_planned_mhrs_series(df[PLANNED_MHRS_COLUMN])
 
     logger.info("AFTER BASE HOURS CALCULATION")
     logger.info("-"*80)
@@ -197,13 +200,11 @@ def process_data(input_file_path, reference_data):
     logger.info("")
 
     # Extract task IDs using the BASE mapping (used by both MHR and New Task paths)
-    task_id_data = df.apply(extract_task_id, axis=1)
-    df['Task ID'] = task_id_data.apply(lambda x: x[0])
-    df['Should Check Reference'] = task_id_data.apply(lambda x: x[1])
-    df['Should Process'] = task_id_data.apply(lambda x: x[2])
+    task_id_cols = ['Task ID', 'Should Check Reference', 'Should Process']
+    df[task_id_cols] = _extract_task_id_columns(df, SEQ_MAPPINGS, task_id_cols)
 
     # ── Rows that pass the base "Should Process" gate ──────────────────────
-    df_base = df[df['Should Process'] == True].copy().reset_index(drop=True)
+    df_base = df[df['Should Process'] == True].reset_index(drop=True)
 
     # Deduplicate by SEQ (keep first occurrence); fall back to 'event' if that column exists
     dedup_col = 'event' if 'event' in df_base.columns else SEQ_NO_COLUMN
@@ -271,16 +272,10 @@ def process_data(input_file_path, reference_data):
     # Re-extract task IDs for the New Task sheet using NEWTASK mapping.
     # We go back to df (full, pre-base-filter) so that SEQs ignored in the
     # base mapping but enabled in SEQ_NEWTASK_MAPPINGS can still appear.
-    df['Base Hours'] = df[PLANNED_MHRS_COLUMN].apply(convert_planned_mhrs)  # already done, but safe
-    task_id_data_full = df.apply(
-        lambda row: _extract_task_id_with_mapping(row, SEQ_NEWTASK_MAPPINGS),
-        axis=1
-    )
-    df['_NT_Task_ID'] = task_id_data_full.apply(lambda x: x[0])
-    df['_NT_Should_Check'] = task_id_data_full.apply(lambda x: x[1])
-    df['_NT_Should_Process'] = task_id_data_full.apply(lambda x: x[2])
+    nt_cols = ['_NT_Task_ID', '_NT_Should_Check', '_NT_Should_Process']
+    df[nt_cols] = _extract_task_id_columns(df, SEQ_NEWTASK_MAPPINGS, nt_cols)
 
-    df_newtask = df[df['_NT_Should_Process'] == True].copy().reset_index(drop=True)
+    df_newtask = df[df['_NT_Should_Process'] == True].reset_index(drop=True)
     dedup_col_nt = 'event' if 'event' in df_newtask.columns else SEQ_NO_COLUMN
     df_newtask = df_newtask.drop_duplicates(subset=[dedup_col_nt], keep='first').reset_index(drop=True)
 
@@ -305,8 +300,16 @@ def process_data(input_file_path, reference_data):
     )
 
     # ── Random debug sample (from MHR set) ──────────────────────────────────
-    sample_size = min(RANDOM_SAMPLE_SIZE, len(df_mhr))
-    random_sample = df_mhr.sample(n=sample_size, random_state=1) if len(df_mhr) > 0 else pd.DataFrame()
+    # Only the columns the debug reports print (the log table here and
+    # writers.debug_logger); skip the shuffle when every row would be taken anyway
+    sample_cols = [c for c in (SEQ_NO_COLUMN, TITLE_COLUMN, SPECIAL_CODE_COLUMN, 'Task ID',
+                               'Coefficient', 'Type Coefficient', 'Base Hours', 'Adjusted Hours')
+                   if c in df_mhr.columns]
+    sample_view = df_mhr[sample_cols]
+    if len(sample_view) <= RANDOM_SAMPLE_SIZE:
+        random_sample = sample_view
+    else:
+        random_sample = sample_view.sample(n=RANDOM_SAMPLE_SIZE, random_state=1)
 
     # Special code distribution (MHR set)
     special_code_distribution = None
@@ -330,7 +333,7 @@ def process_data(input_file_path, reference_data):
 
     write_debug_sample_to_log(logger, random_sample, enable_special_code_processing)
 
-    WorkpackLogger().close_file_logger(base_filename)
+    get_workpack_logger().close_file_logger(base_filename)
 
     return {
         'total_mhrs': total_mhrs,
@@ -362,103 +365,91 @@ def process_data(input_file_path, reference_data):
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _extract_task_id_with_mapping(row, sheet_mapping):
+def _extract_task_id_columns(df, sheet_mapping, columns):
     """
-    Variant of extract_task_id that uses a per-sheet SEQ mapping to decide
-    whether to process a row, instead of the base SEQ_MAPPINGS.
+    Extract (task_id, should_check_reference, should_process) for every row,
+    using the given SEQ mapping to decide whether a row is processed.
 
     Returns:
-        tuple: (task_id, should_check_reference, should_process)
+        pd.DataFrame: one column per tuple field, named by `columns`, aligned to df
     """
-    from core.id_extractor import extract_id_from_title
-    from core.config import SEQ_ID_MAPPINGS
-
-    seq_no = str(row[SEQ_NO_COLUMN])
-    seq_prefix = seq_no.split('.')[0]
-    mapping_key = f"SEQ_{seq_prefix}.X"
-
-    seq_mapping_value = sheet_mapping.get(mapping_key, 'true')
-
-    if seq_mapping_value == 'ignore':
-        return (None, False, False)
-
-    id_mapping_key = f"SEQ_{seq_prefix}.X_ID"
-    id_extraction_method = SEQ_ID_MAPPINGS.get(id_mapping_key, '/')
-
-    title = str(row[TITLE_COLUMN])
-    task_id = extract_id_from_title(title, id_extraction_method)
-    should_check = (seq_mapping_value == 'true')
-
-    return (task_id, should_check, True)
+    return pd.DataFrame(dict(zip(columns, extract_task_ids(df, sheet_mapping))), index=df.index)
 
 
 def identify_new_task_ids(df_processed, reference_task_ids, reference_eo_ids):
     """
     Identify task IDs not present in the reference data.
     Carries the TITLE_COLUMN (Description) into the result.
-    """
-    rows_to_check = df_processed[df_processed['Should Check Reference'] == True].copy().reset_index(drop=True)
-    rows_to_check['Is_EO'] = rows_to_check['Task ID'].astype(str).str.startswith(REFERENCE_EO_PREFIX)
 
-    eo_rows = rows_to_check[rows_to_check['Is_EO'] == True].copy().reset_index(drop=True)
-    new_eo_rows = eo_rows[~eo_rows['Task ID'].isin(reference_eo_ids)].copy().reset_index(drop=True)
+    Membership is a hashed isin() against the prebuilt reference sets,
+    so the cost is O(rows + reference IDs) rather than O(rows x reference IDs).
+    """
+    # Boolean masks over the full frame; only the output columns get copied
+    task_ids = df_processed['Task ID']
+    should_check = df_processed['Should Check Reference'] == True
+    is_eo = task_ids.astype(str).str.startswith(REFERENCE_EO_PREFIX)
 
-    task_rows = rows_to_check[rows_to_check['Is_EO'] == False].copy().reset_index(drop=True)
-    new_task_rows = task_rows[~task_rows['Task ID'].isin(reference_task_ids)].copy().reset_index(drop=True)
+    new_eo_mask = should_check & is_eo & ~task_ids.isin(reference_eo_ids)
+    new_task_mask = should_check & ~is_eo & ~task_ids.isin(reference_task_ids)
 
     cols = [SEQ_NO_COLUMN, 'Task ID', TITLE_COLUMN]
     # Guard: only select columns that actually exist
     cols = [c for c in cols if c in df_processed.columns]
 
-    new_task_ids_with_seq = pd.concat([new_eo_rows, new_task_rows]).reset_index(drop=True)[cols].copy()
+    new_task_ids_with_seq = pd.concat([
+        df_processed.loc[new_eo_mask, cols],
+        df_processed.loc[new_task_mask, cols],
+    ]).reset_index(drop=True)
     return new_task_ids_with_seq
 
 
 def write_debug_sample_to_log(logger, debug_df, enable_special_code):
-    """Write the debug sample section to the log file."""
-    logger.info("")
-    logger.info("="*80)
-    logger.info("DEBUG SAMPLE REPORT")
-    logger.info("="*80)
+    """
+    Write the debug sample section to the log file.
+
+    Logged at DEBUG so it stays in the per-file log without being echoed
+    to the console for every file.
+    """
+    logger.debug("")
+    logger.debug("="*80)
+    logger.debug("DEBUG SAMPLE REPORT")
+    logger.debug("="*80)
 
     if len(debug_df) == 0:
-        logger.info("No data to display (all rows were ignored)")
+        logger.debug("No data to display (all rows were ignored)")
         return
 
-    logger.info(f"Random Sample ({len(debug_df)} Rows):")
-    logger.info("-"*120)
+    logger.debug(f"Random Sample ({len(debug_df)} Rows):")
+    logger.debug("-"*120)
+
+    # Format both hours columns in one pass instead of once per row
+    base_hhmm = hours_to_hhmm_series(debug_df['Base Hours']).to_numpy()
+    adjusted_hhmm = hours_to_hhmm_series(debug_df['Adjusted Hours']).to_numpy()
 
     if enable_special_code:
-        logger.info(f"| {SEQ_NO_COLUMN:<8} | Special Code | Task ID          | Coefficient | Base Mhrs | Adjusted Mhrs |")
-        logger.info("-"*120)
-
-        for idx, row in debug_df.iterrows():
-            seq_no = str(row[SEQ_NO_COLUMN])
-            special_code = str(row.get(SPECIAL_CODE_COLUMN, 'N/A')) if pd.notna(row.get(SPECIAL_CODE_COLUMN)) else "N/A"
-            special_code = special_code[:12]
-            task_id = str(row['Task ID'])[:16]
-            coefficient = row.get('Coefficient', 1.0)
-            base_hours = row.get('Base Hours', 0)
-            adjusted_hours = row.get('Adjusted Hours', 0)
-            base_time_hhmm = hours_to_hhmm(base_hours)
-            adjusted_time_hhmm = hours_to_hhmm(adjusted_hours)
-            logger.info(
+        logger.debug(f"| {SEQ_NO_COLUMN:<8} | Special Code | Task ID          | Coefficient | Base Mhrs | Adjusted Mhrs |")
+        logger.debug("-"*120)
+
+        sample_cols = [SEQ_NO_COLUMN, SPECIAL_CODE_COLUMN, 'Task ID', 'Coefficient']
+        for (seq_no, special_code, task_id, coefficient), base_time_hhmm, adjusted_time_hhmm in zip(
+                debug_df[sample_cols].itertuples(index=False, name=None), base_hhmm, adjusted_hhmm):
+            seq_no = str(seq_no)
+            special_code = str(special_code)[:12] if pd.notna(special_code) else "N/A"
+            task_id = str(task_id)[:16]
+            logger.debug(
                 f"| {seq_no:<8} | {special_code:<12} | {task_id:<16} | {coefficient:<11.2f} | {base_time_hhmm:>9} | {adjusted_time_hhmm:>13} |")
     else:
-        logger.info(
+        logger.debug(
             f"| {SEQ_NO_COLUMN:<8} | {TITLE_COLUMN[:30]:<30} | Task ID          | Coefficient | Base Mhrs | Adjusted Mhrs |")
-        logger.info("-"*125)
-
-        for idx, row in debug_df.iterrows():
-            seq_no = str(row[SEQ_NO_COLUMN])
-            title = str(row[TITLE_COLUMN])[:30]
-            task_id = str(row['Task ID'])[:16]
-            coefficient = row.get('Coefficient', 1.0)
-            base_hours = row.get('Base Hours', 0)
-            adjusted_hours = row.get('Adjusted Hours', 0)
-            base_time_hhmm = hours_to_hhmm(base_hours)
-            adjusted_time_hhmm = hours_to_hhmm(adjusted_hours)
-            logger.info(
+        logger.debug("-"*125)
+
+        sample_cols = [SEQ_NO_COLUMN, TITLE_COLUMN, 'Task ID', 'Coefficient']
+        for (seq_no, title, task_id, coefficient), base_time_hhmm, adjusted_time_hhmm in zip(
+                debug_df[sample_cols].itertuples(index=False, name=None), base_hhmm, adjusted_hhmm):
+            seq_no = str(seq_no)
+            title = str(title)[:30]
+            task_id = str(task_id)[:16]
+            logger.debug(
                 f"| {seq_no:<8} | {title:<30} | {task_id:<16} | {coefficient:<11.2f} | {base_time_hhmm:>9} | {adjusted_time_hhmm:>13} |")
 
-    logger.info("-"*120)
\ No newline at end of file
+    logger.debug("-"*120)
\ No newline at end of file
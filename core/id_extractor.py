@@ -3,6 +3,9 @@ ID Extractor Module
 Handles extraction of task IDs from titles based on SEQ configuration
 """
 
+import numpy as np
+import pandas as pd
+
 from .config import SEQ_NO_COLUMN, TITLE_COLUMN, SEQ_MAPPINGS, SEQ_ID_MAPPINGS
 
 
@@ -19,14 +22,30 @@ def extract_task_id(row):
             - should_check_reference: Whether to check against reference for new IDs
             - should_process: Whether to include this row in processing at all
     """
-    seq_no = str(row[SEQ_NO_COLUMN])
+    return extract_task_id_from_values(row[SEQ_NO_COLUMN], row[TITLE_COLUMN])
+
+
+def extract_task_id_from_values(seq_no, title, seq_mappings=SEQ_MAPPINGS):
+    """
+    Scalar variant of extract_task_id that takes the SEQ and title directly,
+    so callers can iterate plain tuples instead of building a row per call.
+
+    Args:
+        seq_no: SEQ identifier (e.g., "2.1", "4.39")
+        title: Title value the ID is extracted from
+        seq_mappings: SEQ mapping deciding include/ignore (default: SEQ_MAPPINGS)
+
+    Returns:
+        tuple: (task_id, should_check_reference, should_process)
+    """
+    seq_no = str(seq_no)
 
     # Extract the SEQ prefix (e.g., "4.39" -> "4")
     seq_prefix = seq_no.split('.')[0]
 
-    # Get the processing mode from SEQ_MAPPINGS
+    # Get the processing mode from the SEQ mapping
     mapping_key = f"SEQ_{seq_prefix}.X"
-    seq_mapping = SEQ_MAPPINGS.get(mapping_key, "true")
+    seq_mapping = seq_mappings.get(mapping_key, "true")
 
     # If set to "ignore", skip this row entirely
     if seq_mapping == "ignore":
@@ -37,10 +56,9 @@ def extract_task_id(row):
     id_extraction_method = SEQ_ID_MAPPINGS.get(id_mapping_key, "/")
 
     # Extract the task ID from the title
-    title = str(row[TITLE_COLUMN])
-    task_id = extract_id_from_title(title, id_extraction_method)
+    task_id = extract_id_from_title(str(title), id_extraction_method)
 
-    # Determine if we should check reference based on SEQ_MAPPINGS value
+    # Determine if we should check reference based on the SEQ mapping value
     should_check = (seq_mapping == "true")
 
     return (task_id, should_check, True)  # Process this row
@@ -83,6 +101,66 @@ def extract_id_from_title(title, extraction_method):
         return title.strip()
 
 
+def extract_task_ids(df, seq_mappings=SEQ_MAPPINGS):
+    """
+    Vectorized extract_task_id over a whole DataFrame.
+
+    Resolves the SEQ mapping and ID extraction method per row with pandas
+    string operations instead of calling extract_task_id once per row.
+
+    Args:
+        df (pd.DataFrame): DataFrame with SEQ_NO_COLUMN and TITLE_COLUMN
+        seq_mappings: SEQ mapping deciding include/ignore (default: SEQ_MAPPINGS)
+
+    Returns:
+        tuple: (task_ids, should_check_reference, should_process) as Series aligned to df
+    """
+    seq_prefixes = get_seq_prefixes(df[SEQ_NO_COLUMN]).astype('category')
+
+    seq_mapping = lookup_seq_mapping(seq_prefixes, seq_mappings, ".X", "true")
+    extraction_methods = lookup_seq_mapping(seq_prefixes, SEQ_ID_MAPPINGS, ".X_ID", "/")
+
+    should_process = seq_mapping != "ignore"
+    should_check = seq_mapping == "true"
+
+    task_ids = extract_ids_from_titles(df[TITLE_COLUMN], extraction_methods)
+    task_ids = task_ids.where(should_process, None)
+
+    return task_ids, should_check, should_process
+
+
+# Leading part of a title kept by each ID extraction method
+_ID_PATTERNS = (
+    ("-", r"^([^(]*)"),
+    ("/", r"^([^/]*)"),
+)
+
+
+def extract_ids_from_titles(titles, extraction_methods):
+    """
+    Vectorized extract_id_from_title.
+
+    Args:
+        titles (pd.Series): Title values
+        extraction_methods (pd.Series): "-" or "/" per row, aligned to titles
+
+    Returns:
+        pd.Series: Extracted ID strings
+    """
+    titles = titles.astype(str)
+    ids = titles.copy()
+
+    # "-": everything before "(", "/": everything before the first "/",
+    # anything else: the whole title. Each title is only run through the
+    # regex for its own method.
+    for method, pattern in _ID_PATTERNS:
+        rows = (extraction_methods == method).to_numpy()
+        if rows.any():
+            ids.loc[rows] = titles[rows].str.extract(pattern, expand=False).to_numpy()
+
+    return ids.str.strip()
+
+
 def get_seq_prefix(seq_no):
     """
     Extract the major version prefix from a SEQ number.
@@ -102,6 +180,44 @@ def get_seq_prefix(seq_no):
     return str(seq_no).split('.')[0]
 
 
+def get_seq_prefixes(seq_values):
+    """
+    Vectorized get_seq_prefix for a Series of SEQ values.
+
+    Args:
+        seq_values (pd.Series): SEQ identifiers
+
+    Returns:
+        pd.Series: The major version prefix of each SEQ
+    """
+    return seq_values.astype(str).str.split('.', n=1).str[0]
+
+
+def lookup_seq_mapping(seq_prefixes, mapping, key_suffix=".X", default="true"):
+    """
+    Look up the "SEQ_<prefix><key_suffix>" setting for every row.
+
+    Prefixes repeat heavily, so they are handled as a Categorical: the
+    mapping is resolved once per distinct prefix and broadcast back to the
+    rows by category code.
+
+    Args:
+        seq_prefixes (pd.Series): SEQ prefixes, e.g. from get_seq_prefixes()
+        mapping (dict): Configuration mapping such as SEQ_MAPPINGS
+        key_suffix (str): ".X" for include/ignore settings, ".X_ID" for ID methods
+        default (str): Value for prefixes missing from the mapping
+
+    Returns:
+        pd.Series: Mapped value per row, aligned to seq_prefixes
+    """
+    prefixes = seq_prefixes.astype('category')
+    per_category = np.array(
+        [mapping.get(f"SEQ_{prefix}{key_suffix}", default) for prefix in prefixes.cat.categories],
+        dtype=object
+    )
+    return pd.Series(per_category[prefixes.cat.codes.to_numpy()], index=seq_prefixes.index)
+
+
 def should_process_seq(seq_no):
     """
     Determine if a SEQ should be processed based on configuration.
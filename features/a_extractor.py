@@ -7,6 +7,7 @@ UPDATED: Filters bonus hours by IsActive column
 import pandas as pd
 import os
 from utils.logger import get_logger
+from utils.excel_utils import read_excel_sheets_cached
 from core.config import (A_COLUMN, REFERENCE_FOLDER, BONUS_HOURS_FILE,
                          AC_TYPE_FILE, AC_TYPE_REGISTRATION_COLUMN,
                          AC_TYPE_TYPE_COLUMN, BONUS_1_COLUMN, BONUS_2_COLUMN,
@@ -42,7 +43,8 @@ def load_ac_type_lookup():
         return {}
 
     try:
-        df = pd.read_excel(ac_type_file, engine='openpyxl')
+        # First sheet only, matching a plain read_excel call
+        df = next(iter(read_excel_sheets_cached(ac_type_file).values()))
 
         required_cols = [AC_TYPE_TYPE_COLUMN, AC_TYPE_REGISTRATION_COLUMN]
         missing_cols = [col for col in required_cols if col not in df.columns]
@@ -117,18 +119,17 @@ def load_bonus_hours_lookup():
         return {}
 
     try:
-        excel_file = pd.ExcelFile(bonus_file_path, engine='openpyxl')
+        sheets = read_excel_sheets_cached(bonus_file_path)
         bonus_lookup = {}
 
         logger.info("")
         logger.info(f"Loading bonus hours from {BONUS_HOURS_FILE}...")
-        logger.info(f"Found {len(excel_file.sheet_names)} sheets to process")
+        logger.info(f"Found {len(sheets)} sheets to process")
 
         total_rows_processed = 0
         total_rows_skipped_inactive = 0
 
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
+        for sheet_name, df in sheets.items():
             logger.debug(f"Processing sheet '{sheet_name}'...")
 
             rows_before_filter = len(df)
@@ -267,7 +268,8 @@ def get_bonus_breakdown_by_source(ac_type, wp_type, file_logger=None):
         file_logger = get_logger(module_name="a_extractor")
 
     try:
-        excel_file = pd.ExcelFile(bonus_file_path, engine='openpyxl')
+        # Shares the parse done by load_bonus_hours_lookup()
+        sheets = read_excel_sheets_cached(bonus_file_path)
         breakdown = {}
 
         file_logger.info("")
@@ -278,9 +280,7 @@ def get_bonus_breakdown_by_source(ac_type, wp_type, file_logger=None):
         file_logger.info(f"File: {BONUS_HOURS_FILE}")
         file_logger.info("")
 
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
-
+        for sheet_name, df in sheets.items():
             if AIRCRAFT_CODE_COLUMN not in df.columns or PRODUCT_CODE_COLUMN not in df.columns:
                 continue
 
@@ -4,9 +4,12 @@ REFACTORED: Now uses centralized logging system
 UPDATED: Added percentage column support
 """
 
+import numpy as np
 import pandas as pd
 import os
 from utils.logger import get_logger
+from core.id_extractor import get_seq_prefixes, lookup_seq_mapping, extract_ids_from_titles
+from utils.excel_utils import read_excel_fast
 from core.config import (SEQ_NO_COLUMN, TITLE_COLUMN,
                          TOOL_NAME_COLUMN, TOOL_TYPE_COLUMN, TOOL_PARTNO_COLUMN,
                          TOTAL_QTY_COLUMN, ALT_QTY_COLUMN, TOOL_PERCENTAGE_COLUMN, config)
@@ -98,28 +101,68 @@ def extract_task_id_for_tool_control(row, seq_mappings, seq_id_mappings):
     Returns:
         str: Extracted Task ID
     """
-    seq_no = str(row[SEQ_NO_COLUMN])
-    seq_prefix = seq_no.split('.')[0]
+    seq_prefix = str(row[SEQ_NO_COLUMN]).partition('.')[0]
 
     # Get the ID extraction method
-    id_mapping_key = f"SEQ_{seq_prefix}.X_ID"
-    id_extraction_method = seq_id_mappings.get(id_mapping_key, "/")
+    id_extraction_method = seq_id_mappings.get(f"SEQ_{seq_prefix}.X_ID", "/")
 
-    # Extract the task ID from the title
+    # Extract the task ID from the title: the part before the first "(" or
+    # "/" (the whole title if the separator is missing)
     title = str(row[TITLE_COLUMN])
 
     if id_extraction_method == "-":
-        if "(" in title:
-            return title.split("(")[0].strip()
-        return title.strip()
+        return title.partition("(")[0].strip()
     elif id_extraction_method == "/":
-        if "/" in title:
-            return title.split("/")[0].strip()
-        return title.strip()
+        return title.partition("/")[0].strip()
     else:
         return title.strip()
 
 
+def extract_task_ids_for_tool_control(df, seq_id_mappings):
+    """
+    Vectorized extract_task_id_for_tool_control over a whole DataFrame.
+
+    Args:
+        df: DataFrame with SEQ_NO_COLUMN and TITLE_COLUMN
+        seq_id_mappings: SEQ ID extraction configuration
+
+    Returns:
+        pd.Series: Extracted Task ID per row, aligned to df
+    """
+    seq_prefixes = get_seq_prefixes(df[SEQ_NO_COLUMN])
+    extraction_methods = lookup_seq_mapping(seq_prefixes, seq_id_mappings, ".X_ID", "/")
+    return extract_ids_from_titles(df[TITLE_COLUMN], extraction_methods)
+
+
+def map_tool_types(tool_types):
+    """
+    Map tool type flags to readable labels for a whole column.
+
+    'Y' becomes 'Tool' and 'N' becomes 'Spare' (case and surrounding
+    whitespace ignored), blanks become 'Unknown' and any other value is
+    kept as its string form.
+
+    Args:
+        tool_types (pd.Series): Tool type indicator values
+
+    Returns:
+        pd.Series: Type label per row, aligned to tool_types
+    """
+    as_text = tool_types.astype(str)
+    flags = as_text.str.strip().str.upper()
+    labels = np.select(
+        [tool_types.isna().to_numpy(), (flags == 'Y').to_numpy(), (flags == 'N').to_numpy()],
+        ['Unknown', 'Tool', 'Spare'],
+        default=as_text.to_numpy(dtype=object)
+    )
+    return pd.Series(labels, index=tool_types.index, dtype=object)
+
+
+def _has_text(values):
+    """Boolean array: value is present and not blank once stripped."""
+    return values.notna().to_numpy() & (values.astype(str).str.strip() != '').to_numpy()
+
+
 def check_tool_availability(df, seq_mappings, seq_id_mappings):
     """
     Check for tools/spares with zero quantity.
@@ -147,33 +190,38 @@ def check_tool_availability(df, seq_mappings, seq_id_mappings):
         logger.warning(f"Tool control columns not found in file: {missing_cols}")
         return pd.DataFrame()
 
-    # Load ignore list
-    ignore_items = load_ignore_items()
+    # Quantities as numeric arrays; the input DataFrame itself is not modified.
+    # Blank and non-numeric cells count as 0.
+    total_zero = pd.to_numeric(df[TOTAL_QTY_COLUMN], errors='coerce').fillna(0).to_numpy() == 0
 
-    # Create a working copy
-    df_tools = df.copy()
-
-    # Convert quantity columns to numeric
-    df_tools[TOTAL_QTY_COLUMN] = pd.to_numeric(df_tools[TOTAL_QTY_COLUMN], errors='coerce').fillna(0)
-    df_tools[ALT_QTY_COLUMN] = pd.to_numeric(df_tools[ALT_QTY_COLUMN], errors='coerce').fillna(0)
-
-    # Filter rows where BOTH quantities are 0
-    zero_qty_mask = (
-            (df_tools[TOTAL_QTY_COLUMN] == 0) &
-            (df_tools[ALT_QTY_COLUMN] == 0) &
-            (df_tools[TOOL_NAME_COLUMN].notna()) &
-            (df_tools[TOOL_NAME_COLUMN].astype(str).str.strip() != '') &
-            (df_tools[TOOL_PARTNO_COLUMN].notna()) &
-            (df_tools[TOOL_PARTNO_COLUMN].astype(str).str.strip() != '')
-    )
+    # Fully stocked file: nothing can match, so skip the remaining work
+    if not total_zero.any():
+        return pd.DataFrame()
+
+    alt_qty = pd.to_numeric(df[ALT_QTY_COLUMN], errors='coerce').fillna(0).to_numpy()
+
+    # Filter rows where BOTH quantities are 0, combining plain NumPy arrays
+    zero_qty_mask = np.logical_and.reduce([
+        total_zero,
+        alt_qty == 0,
+        _has_text(df[TOOL_NAME_COLUMN]),
+        _has_text(df[TOOL_PARTNO_COLUMN]),
+    ])
 
-    zero_qty_items = df_tools[zero_qty_mask].copy()
+    # Copy only the matching rows and the columns the report uses
+    output_cols = [SEQ_NO_COLUMN, TITLE_COLUMN, TOOL_PARTNO_COLUMN, TOOL_NAME_COLUMN, TOOL_TYPE_COLUMN]
+    if TOOL_PERCENTAGE_COLUMN and TOOL_PERCENTAGE_COLUMN in df.columns:
+        output_cols.append(TOOL_PERCENTAGE_COLUMN)
+    zero_qty_items = df.loc[zero_qty_mask, output_cols].copy()
 
     if len(zero_qty_items) == 0:
         return pd.DataFrame()
 
     logger.info(f"Found {len(zero_qty_items)} items with zero availability (before filtering)")
 
+    # Load ignore list
+    ignore_items = load_ignore_items()
+
     # Apply ignore list filtering
     filtered_items = []
     ignored_count = 0
@@ -203,25 +251,11 @@ def check_tool_availability(df, seq_mappings, seq_id_mappings):
 
     zero_qty_items = pd.DataFrame(filtered_items)
 
-    # Extract Task ID for each row
-    zero_qty_items['Task ID'] = zero_qty_items.apply(
-        lambda row: extract_task_id_for_tool_control(row, seq_mappings, seq_id_mappings),
-        axis=1
-    )
+    # Extract Task IDs for all rows at once
+    zero_qty_items['Task ID'] = extract_task_ids_for_tool_control(zero_qty_items, seq_id_mappings)
 
-    # Map tool type
-    def map_tool_type(value):
-        if pd.isna(value):
-            return 'Unknown'
-        val_str = str(value).strip().upper()
-        if val_str == 'Y':
-            return 'Tool'
-        elif val_str == 'N':
-            return 'Spare'
-        else:
-            return str(value)
-
-    zero_qty_items['Type'] = zero_qty_items[TOOL_TYPE_COLUMN].apply(map_tool_type)
+    # Map tool type: Y -> Tool, N -> Spare, blank -> Unknown, anything else as-is
+    zero_qty_items['Type'] = map_tool_types(zero_qty_items[TOOL_TYPE_COLUMN])
 
     # Extract percentage column if available
     columns_to_select = [SEQ_NO_COLUMN, 'Task ID', TOOL_PARTNO_COLUMN, TOOL_NAME_COLUMN, 'Type']
@@ -245,7 +279,16 @@ def check_tool_availability(df, seq_mappings, seq_id_mappings):
     return result
 
 
-def process_tool_control(input_file_path, seq_mappings, seq_id_mappings):
+# Input columns check_tool_availability reads (percentage column is optional)
+_TOOL_CONTROL_COLUMNS = frozenset(
+    col for col in (SEQ_NO_COLUMN, TITLE_COLUMN, TOOL_NAME_COLUMN, TOOL_TYPE_COLUMN,
+                    TOOL_PARTNO_COLUMN, TOTAL_QTY_COLUMN, ALT_QTY_COLUMN,
+                    TOOL_PERCENTAGE_COLUMN)
+    if col
+)
+
+
+def process_tool_control(input_file_path, seq_mappings, seq_id_mappings, df=None):
     """
     Main function to process tool control independently.
 
@@ -253,13 +296,16 @@ def process_tool_control(input_file_path, seq_mappings, seq_id_mappings):
         input_file_path: Path to the input Excel file
         seq_mappings: SEQ mapping configuration
         seq_id_mappings: SEQ ID extraction configuration
+        df: Already-loaded input DataFrame (optional, avoids re-reading the file)
 
     Returns:
         DataFrame with tool control issues, or empty DataFrame if none found
     """
     try:
-        # Load the uploaded file
-        df = pd.read_excel(input_file_path, engine='openpyxl')
+        # Load the uploaded file unless the caller already parsed it;
+        # only the columns tool control reads are converted
+        if df is None:
+            df = read_excel_fast(input_file_path, usecols=_TOOL_CONTROL_COLUMNS.__contains__)
 
         logger.info(f"Processing {len(df)} total rows from input file...")
 
@@ -270,8 +316,9 @@ def process_tool_control(input_file_path, seq_mappings, seq_id_mappings):
             logger.info(f"Found {len(tool_issues)} tool/spare items requiring attention")
 
             # Show breakdown by type
-            tool_count = len(tool_issues[tool_issues['Type'] == 'Tool'])
-            spare_count = len(tool_issues[tool_issues['Type'] == 'Spare'])
+            type_counts = tool_issues['Type'].value_counts()
+            tool_count = int(type_counts.get('Tool', 0))
+            spare_count = int(type_counts.get('Spare', 0))
             logger.info(f"  - Tools: {tool_count}")
             logger.info(f"  - Spares: {spare_count}")
         else:
@@ -305,10 +352,13 @@ def get_tool_control_summary(tool_issues_df):
             'affected_seqs': 0
         }
 
+    # One hash pass over Type gives both the tool and spare counts
+    type_counts = tool_issues_df['Type'].value_counts()
+
     return {
         'total_issues': len(tool_issues_df),
-        'total_tools': len(tool_issues_df[tool_issues_df['Type'] == 'Tool']),
-        'total_spares': len(tool_issues_df[tool_issues_df['Type'] == 'Spare']),
+        'total_tools': int(type_counts.get('Tool', 0)),
+        'total_spares': int(type_counts.get('Spare', 0)),
         'unique_parts': tool_issues_df['Part Number'].nunique(),
         'affected_seqs': tool_issues_df['SEQ'].nunique()
     }
@@ -7,6 +7,7 @@ REFACTORED: Now uses centralized logging system
 import pandas as pd
 import os
 from utils.logger import get_logger
+from utils.excel_utils import read_excel_sheets_cached
 from core.config import (REFERENCE_FOLDER, TYPE_COEFFICIENT_FILE,
                          TYPE_COEFF_AIRCRAFT_COLUMN, TYPE_COEFF_CHECKGROUP_COLUMN,
                          TYPE_COEFF_FUNCTION_COLUMN, TYPE_COEFF_COLUMN,
@@ -33,7 +34,7 @@ def load_type_coefficient_lookup():
         return {}
 
     try:
-        excel_file = pd.ExcelFile(coeff_file_path, engine='openpyxl')
+        sheets = read_excel_sheets_cached(coeff_file_path)
 
         coeff_lookup = {}
 
@@ -41,7 +42,7 @@ def load_type_coefficient_lookup():
         logger.info("="*80)
         logger.info(f"LOADING TYPE COEFFICIENTS from {TYPE_COEFFICIENT_FILE}")
         logger.info("="*80)
-        logger.info(f"Found {len(excel_file.sheet_names)} sheet(s) - will process all")
+        logger.info(f"Found {len(sheets)} sheet(s) - will process all")
         logger.debug(f"Required columns: {TYPE_COEFF_AIRCRAFT_COLUMN}, {TYPE_COEFF_CHECKGROUP_COLUMN}, {TYPE_COEFF_FUNCTION_COLUMN}, {TYPE_COEFF_COLUMN}")
         if TYPE_COEFF_ISACTIVE_COLUMN:
             logger.debug(f"Filter column: {TYPE_COEFF_ISACTIVE_COLUMN} (only TRUE)")
@@ -51,8 +52,7 @@ def load_type_coefficient_lookup():
 
         # Process ALL sheets (combine them)
         all_data = []
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name)
+        for sheet_name, df in sheets.items():
             logger.debug(f"Reading sheet '{sheet_name}': {len(df)} rows")
             all_data.append(df)
 
@@ -4,12 +4,97 @@ Coordinates the entire workpack processing workflow
 REFACTORED: Now uses centralized logging system
 """
 
-from utils.logger import WorkpackLogger, info, error, warning
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils.logger import flush_logs, get_workpack_logger, info, error, warning
 from core.config import print_config
 from core.data_loader import load_input_files, load_reference_ids
 from core.data_processor import process_data
 from writers.excel_writer import save_output_file
 
+# Banner lines are logged many times; build them once
+_SEPARATOR = "=" * 80
+_RULE = "-" * 80
+
+
+def process_single_file(input_file, reference_data):
+    """
+    Process one input file and save its output report.
+
+    Runs in a worker process when several files are processed, so errors
+    are returned rather than raised.
+
+    Args:
+        input_file (str): Path to the input Excel file
+        reference_data (dict): Reference ID sets from load_reference_ids()
+
+    Returns:
+        tuple: (input_file, error message or None on success)
+    """
+    try:
+        # Process the data
+        processed_data = process_data(input_file, reference_data)
+
+        # Save the output
+        save_output_file(input_file, processed_data)
+
+        return input_file, None
+
+    except Exception as e:
+        return input_file, str(e)
+
+    finally:
+        # Worker processes exit without running atexit hooks, so close this
+        # file's log (process_data skips that when it raises) and write out
+        # anything still buffered before handing the result back
+        base_filename = os.path.splitext(os.path.basename(input_file))[0]
+        get_workpack_logger().close_file_logger(base_filename)
+        flush_logs()
+
+
+def process_files(input_files, reference_data):
+    """
+    Process every input file, yielding each result as soon as it is ready.
+
+    Files are independent (own output and log folders), so several files
+    run in separate processes; reference data is shipped to each worker.
+    A file is announced when it is queued, and a worker that dies is
+    reported as a failure of its own file only.
+
+    Args:
+        input_files (list): Paths to the input Excel files
+        reference_data (dict): Reference ID sets from load_reference_ids()
+
+    Yields:
+        tuple: (input_file, error message or None on success)
+    """
+    total = len(input_files)
+    max_workers = min(total, os.cpu_count() or 1)
+
+    if max_workers <= 1:
+        for idx, input_file in enumerate(input_files, 1):
+            info(f"File {idx}/{total}: {input_file}")
+            yield process_single_file(input_file, reference_data)
+        return
+
+    info(f"Processing {total} files with {max_workers} worker processes")
+    info("")
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for idx, input_file in enumerate(input_files, 1):
+            info(f"File {idx}/{total}: {input_file}")
+            futures[executor.submit(process_single_file, input_file, reference_data)] = input_file
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # e.g. BrokenProcessPool when a worker crashes
+                result = (futures[future], f"{type(e).__name__}: {e}")
+            yield result
+
 
 def main():
     """
@@ -19,31 +104,31 @@ def main():
     1. Print and verify configuration
     2. Load input files from INPUT folder
     3. Load reference data (Task IDs and EO IDs)
-    4. Process each input file
+    4. Process each input file (in worker processes when there are several)
     5. Generate output reports
 
     Returns:
         None
     """
     # Initialize logging system
-    wl = WorkpackLogger()
+    wl = get_workpack_logger()
 
-    info("="*80)
+    info(_SEPARATOR)
     info("WORKPACK DATA PROCESSING SYSTEM")
-    info("="*80)
+    info(_SEPARATOR)
     info("")
 
     # Step 1: Print configuration for verification
     info("Configuration:")
-    info("-"*80)
+    info(_RULE)
     print_config()
     info("")
-    info("="*80)
+    info(_SEPARATOR)
     info("")
 
     # Step 2: Load input files
     info("Step 1: Loading Input Files")
-    info("-"*80)
+    info(_RULE)
     input_files = load_input_files()
 
     if not input_files:
@@ -54,54 +139,43 @@ def main():
 
     info(f"Found {len(input_files)} file(s) to process")
     info("")
-    info("="*80)
+    info(_SEPARATOR)
     info("")
 
     # Step 3: Load reference data
     info("Step 2: Loading Reference Data")
-    info("-"*80)
+    info(_RULE)
     reference_data = load_reference_ids()
     info("")
-    info("="*80)
+    info(_SEPARATOR)
     info("")
 
     # Step 4: Process each file
     info("Step 3: Processing Files")
-    info("="*80)
+    info(_SEPARATOR)
     info("")
 
     successful_count = 0
     failed_count = 0
 
-    for idx, input_file in enumerate(input_files, 1):
-        info(f"Processing file {idx}/{len(input_files)}: {input_file}")
-        info("-"*80)
-
-        try:
-            # Process the data
-            processed_data = process_data(input_file, reference_data)
-
-            # Save the output
-            save_output_file(input_file, processed_data)
-
-            info(f"✓ Successfully processed {input_file}")
-            info("")
+    # Skip building the per-file progress messages when INFO is switched off
+    log_info = wl.main_logger.isEnabledFor(logging.INFO)
+    for input_file, error_message in process_files(input_files, reference_data):
+        if error_message is None:
+            if log_info:
+                info(f"✓ Successfully processed {input_file}")
             successful_count += 1
-
-        except Exception as e:
-            error(f"✗ Error processing {input_file}: {e}")
-            error(f"Skipping to next file...")
-            info("")
+        else:
+            error(f"✗ Error processing {input_file}: {error_message}")
             failed_count += 1
-            continue
-
-        info("-"*80)
-        info("")
+        if log_info:
+            info(_RULE)
+            info("")
 
     # Step 5: Summary
-    info("="*80)
+    info(_SEPARATOR)
     info("PROCESSING COMPLETE")
-    info("="*80)
+    info(_SEPARATOR)
     info("")
 
     if failed_count == 0:
@@ -114,7 +188,7 @@ def main():
     info("  - Excel reports: OUTPUT/")
     info("  - Processing logs: LOG/")
     info("")
-    info("="*80)
+    info(_SEPARATOR)
 
 
 def quick_test():
@@ -122,9 +196,9 @@ def quick_test():
     Quick test function to verify the system is working.
     Run this to check configuration and imports without processing files.
     """
-    info("="*80)
+    info(_SEPARATOR)
     info("QUICK SYSTEM TEST")
-    info("="*80)
+    info(_SEPARATOR)
     info("")
 
     info("Testing imports...")
@@ -159,9 +233,9 @@ def quick_test():
         return False
 
     info("")
-    info("="*80)
+    info(_SEPARATOR)
     info("✓ SYSTEM TEST PASSED")
-    info("="*80)
+    info(_SEPARATOR)
 
     return True
 
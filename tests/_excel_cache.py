@@ -0,0 +1,76 @@
+"""
+Test Excel Cache Module
+Memoizes Excel reads so the test suite parses each workbook sheet once per run
+"""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+from utils.excel_utils import EXCEL_READ_ENGINE
+
+
+@lru_cache(maxsize=8)
+def _cached_read_excel(path, sheet_name, mtime, nrows=None):
+    """
+    Parse one sheet with the fastest available engine (calamine when installed).
+
+    mtime is part of the cache key so an edited file is re-read.
+    """
+    return pd.read_excel(path, sheet_name=sheet_name, engine=EXCEL_READ_ENGINE, nrows=nrows)
+
+
+def read_excel_cached(path, sheet_name=0, nrows=None):
+    """
+    Read an Excel sheet, reusing the parsed DataFrame while the file is unchanged.
+
+    The returned DataFrame is shared between callers and must not be modified.
+
+    Args:
+        path (str): Path to the Excel file
+        sheet_name (int or str): Sheet index or name (default: first sheet)
+        nrows (int): Only parse this many data rows (default: all)
+
+    Returns:
+        pd.DataFrame: Parsed sheet
+    """
+    return _cached_read_excel(path, sheet_name, os.path.getmtime(path), nrows)
+
+
+@lru_cache(maxsize=8)
+def _cached_data_row_count(path, sheet_name, mtime):
+    """Count data rows from the sheet dimensions; mtime keys out edited files."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, keep_links=False)
+    try:
+        if isinstance(sheet_name, int):
+            worksheet = workbook.worksheets[sheet_name]
+        else:
+            worksheet = workbook[sheet_name]
+        max_row = worksheet.max_row
+    finally:
+        workbook.close()
+
+    if max_row is None:
+        # No dimensions recorded in the file - count by parsing instead
+        return len(read_excel_cached(path, sheet_name))
+    return max(max_row - 1, 0)  # minus the header row
+
+
+def count_data_rows(path, sheet_name=0):
+    """
+    Get the number of data rows in a sheet without parsing its cells.
+
+    Uses the worksheet's recorded max_row, so trailing rows that only carry
+    formatting are counted too.
+
+    Args:
+        path (str): Path to the Excel file
+        sheet_name (int or str): Sheet index or name (default: first sheet)
+
+    Returns:
+        int: Number of rows below the header
+    """
+    return _cached_data_row_count(path, sheet_name, os.path.getmtime(path))
@@ -0,0 +1,30 @@
+"""
+Test Filesystem Cache Module
+Memoizes os.stat so repeated existence checks on the same path cost one syscall
+"""
+
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def stat(path):
+    """Return os.stat(path), cached for the rest of the test run."""
+    return os.stat(path)
+
+
+def exists(path):
+    """
+    Cached equivalent of os.path.exists().
+
+    Args:
+        path (str): File or folder path
+
+    Returns:
+        bool: True if the path exists
+    """
+    try:
+        stat(path)
+        return True
+    except OSError:
+        return False
@@ -112,6 +112,11 @@ def validate_seq_mappings():
     """
     required_seqs = ["SEQ_2.X", "SEQ_3.X", "SEQ_4.X"]
 
+    # One set check for the usual case; only look for the key to report
+    # when something is missing
+    if set(required_seqs).issubset(SEQ_MAPPINGS):
+        return True
+
     for seq in required_seqs:
         if seq not in SEQ_MAPPINGS:
             print(f"WARNING: {seq} not found in SEQ_MAPPINGS")
@@ -5,10 +5,18 @@ Incorporates functionality from the original debug.py
 """
 
 import os
+import tempfile
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from utils.time_utils import hours_to_hhmm, convert_planned_mhrs, time_to_hours
+from openpyxl import Workbook
+from utils.time_utils import (hours_to_hhmm, hours_to_hhmm_series, convert_planned_mhrs,
+                              convert_planned_mhrs_series, time_to_hours)
 from utils.validation import validate_required_columns, check_column_exists
+from utils.excel_utils import read_excel_fast, EXCEL_READ_ENGINE
+from ._excel_cache import read_excel_cached, count_data_rows
+from ._fs_cache import exists
+from core.data_loader import iter_input_files
 from core.config import (INPUT_FOLDER, REFERENCE_FOLDER, REFERENCE_FILE,
                          SEQ_NO_COLUMN, TITLE_COLUMN, PLANNED_MHRS_COLUMN,
                          REFERENCE_TASK_SHEET_NAME)
@@ -79,6 +87,19 @@ def test_data_quality():
     if not input_test_result['passed']:
         result['warnings'].extend(input_test_result['warnings'])
 
+    result['output'].append("")
+
+    # Test 5: Excel reader (python-calamine when installed, else openpyxl)
+    result['output'].append("Test 5: Excel Reader")
+    result['output'].append("-" * 60)
+
+    reader_test_result = test_excel_reader()
+    result['output'].extend(reader_test_result['output'])
+
+    if not reader_test_result['passed']:
+        result['passed'] = False
+        result['errors'].extend(reader_test_result['errors'])
+
     return result
 
 
@@ -115,6 +136,21 @@ def test_time_conversions():
             result['errors'].append(f"hours_to_hhmm({hours}) failed")
             result['passed'] = False
 
+    # Compare the vectorized version against all expected values at once
+    # and report only the cases that differ
+    hours_input = np.array([h for h, _ in test_cases], dtype=float)
+    series_expected = np.array([expected for _, expected in test_cases])
+    series_actual = hours_to_hhmm_series(pd.Series(hours_input)).to_numpy(dtype=str)
+    mismatches = np.flatnonzero(series_actual != series_expected)
+    if mismatches.size == 0:
+        result['output'].append(f"  ✓ hours_to_hhmm_series() matches scalar results")
+    else:
+        for i in mismatches:
+            result['output'].append(f"  ✗ hours_to_hhmm_series() gave {series_actual[i]} for {hours_input[i]} "
+                                    f"hours (expected {series_expected[i]})")
+        result['errors'].append("hours_to_hhmm_series() failed")
+        result['passed'] = False
+
     # Test convert_planned_mhrs (minutes to hours)
     result['output'].append("")
     result['output'].append("Testing convert_planned_mhrs():")
@@ -135,9 +171,67 @@ def test_time_conversions():
             result['errors'].append(f"convert_planned_mhrs({minutes}) failed")
             result['passed'] = False
 
+    # The vectorized column version must agree with the scalar one
+    series_input = pd.Series([m for m, _ in minutes_test_cases] + [None, 'n/a'])
+    series_actual = convert_planned_mhrs_series(series_input).to_numpy()
+    series_expected = np.array([h for _, h in minutes_test_cases] + [0.0, 0.0])
+    mismatches = np.flatnonzero(series_actual != series_expected)
+    if mismatches.size == 0:
+        result['output'].append(f"  ✓ convert_planned_mhrs_series() matches scalar results")
+    else:
+        for i in mismatches:
+            result['output'].append(f"  ✗ convert_planned_mhrs_series() gave {series_actual[i]} for "
+                                    f"{series_input[i]!r} (expected {series_expected[i]})")
+        result['errors'].append("convert_planned_mhrs_series() failed")
+        result['passed'] = False
+
+    # Test time_to_hours on text values. In-range "H:MM:SS" is parsed
+    # directly; anything else must give what pd.to_timedelta gives
+    result['output'].append("")
+    result['output'].append("Testing time_to_hours():")
+
+    def to_timedelta_hours(time_str):
+        try:
+            return pd.to_timedelta(time_str).total_seconds() / 3600.0
+        except Exception:
+            return 0.0
+
+    text_test_cases = [
+        ("02:30:00", 2.5),
+        ("36:30:00", 36.5),
+        ("1 days 12:30:00", 36.5),
+        ("1:75:00", to_timedelta_hours("1:75:00")),
+        ("0:00:99", to_timedelta_hours("0:00:99")),
+        ("n/a", 0.0),
+    ]
+
+    for time_str, expected_hours in text_test_cases:
+        actual = time_to_hours(time_str)
+        if actual == expected_hours:
+            result['output'].append(f"  ✓ {time_str!r} = {actual} hours")
+        else:
+            result['output'].append(f"  ✗ {time_str!r} = {actual} hours (expected {expected_hours})")
+            result['errors'].append(f"time_to_hours({time_str!r}) failed")
+            result['passed'] = False
+
     return result
 
 
+@lru_cache(maxsize=1)
+def _build_sample_df():
+    """Build the validation fixture once."""
+    return pd.DataFrame({
+        'Column1': [1, 2, 3],
+        'Column2': ['a', 'b', 'c'],
+        'Column3': [10.5, 20.3, 30.1]
+    })
+
+
+def _sample_df():
+    """Return a shallow copy of the cached sample DataFrame, so callers can't alter the cache."""
+    return _build_sample_df().copy(deep=False)
+
+
 def test_validation_functions():
     """
     Test validation utility functions.
@@ -151,12 +245,7 @@ def test_validation_functions():
         'output': []
     }
 
-    # Create sample DataFrame for testing
-    sample_df = pd.DataFrame({
-        'Column1': [1, 2, 3],
-        'Column2': ['a', 'b', 'c'],
-        'Column3': [10.5, 20.3, 30.1]
-    })
+    sample_df = _sample_df()
 
     result['output'].append("Testing validation functions with sample DataFrame:")
 
@@ -181,6 +270,53 @@ def test_validation_functions():
     return result
 
 
+def test_excel_reader():
+    """
+    Test that read_excel_fast reads blank cells as NaN, like pd.read_excel.
+
+    Returns:
+        dict: Test results
+    """
+    result = {
+        'passed': True,
+        'errors': [],
+        'output': []
+    }
+
+    result['output'].append(f"Testing read_excel_fast() with blank cells (engine: {EXCEL_READ_ENGINE}):")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'blank_cells.xlsx')
+        workbook = Workbook()
+        worksheet = workbook.active
+        worksheet.append([SEQ_NO_COLUMN, TITLE_COLUMN, PLANNED_MHRS_COLUMN])
+        worksheet.append(['1.1', None, 30])
+        worksheet.append(['1.2', 'EO-2024-001 / CABIN AIR SYSTEM', None])
+        workbook.save(path)
+
+        actual = read_excel_fast(path)
+        expected = pd.read_excel(path, engine='openpyxl')
+
+    # pd.isna(None) is also True, so check for a float NaN explicitly:
+    # a None would show up as the text 'None' once written out
+    blank_title = actual[TITLE_COLUMN].iloc[0]
+    if isinstance(blank_title, float) and pd.isna(blank_title):
+        result['output'].append("  ✓ Blank text cell reads as NaN")
+    else:
+        result['output'].append(f"  ✗ Blank text cell reads as {blank_title!r} (expected NaN)")
+        result['errors'].append("read_excel_fast() blank cell is not NaN")
+        result['passed'] = False
+
+    if actual.astype(str).equals(expected.astype(str)):
+        result['output'].append("  ✓ Result matches pd.read_excel()")
+    else:
+        result['output'].append("  ✗ Result differs from pd.read_excel()")
+        result['errors'].append("read_excel_fast() differs from pd.read_excel()")
+        result['passed'] = False
+
+    return result
+
+
 def test_reference_file():
     """
     Test reference file accessibility and B84 validation.
@@ -198,20 +334,20 @@ def test_reference_file():
 
     result['output'].append(f"Checking reference file: {reference_file_path}")
 
-    if not os.path.exists(reference_file_path):
+    if not exists(reference_file_path):
         result['output'].append(f"  ⚠ Reference file not found")
         result['warnings'].append("Reference file not accessible")
         result['passed'] = False
         return result
 
     try:
-        # Try to load the reference file
-        df = pd.read_excel(reference_file_path, sheet_name=REFERENCE_TASK_SHEET_NAME, engine='openpyxl')
+        # Only the row count is checked, so read it from the sheet dimensions
+        row_count = count_data_rows(reference_file_path, sheet_name=REFERENCE_TASK_SHEET_NAME)
         result['output'].append(f"  ✓ Reference file loaded successfully")
-        result['output'].append(f"  ✓ Sheet '{REFERENCE_TASK_SHEET_NAME}' found with {len(df)} rows")
+        result['output'].append(f"  ✓ Sheet '{REFERENCE_TASK_SHEET_NAME}' found with {row_count} rows")
 
         # Check for B84 value (from original debug.py)
-        if len(df) >= 84:
+        if row_count >= 84:
             result['output'].append(f"  ✓ File has sufficient rows for B84 check")
         else:
             result['warnings'].append("File has fewer than 84 rows")
@@ -239,35 +375,39 @@ def test_input_files():
 
     result['output'].append(f"Checking INPUT folder: {INPUT_FOLDER}")
 
-    if not os.path.exists(INPUT_FOLDER):
+    if not exists(INPUT_FOLDER):
         result['output'].append(f"  ⚠ INPUT folder not found")
         result['warnings'].append("INPUT folder does not exist")
         result['passed'] = False
         return result
 
-    # Check for Excel files
-    import glob
-    excel_files = glob.glob(os.path.join(INPUT_FOLDER, "*.xlsx"))
+    # Check for Excel files (single scandir pass, lock files skipped).
+    # Only the first file is opened; the rest are counted without building a list.
+    excel_files = iter_input_files(INPUT_FOLDER)
+    first_file = next(excel_files, None)
 
-    if not excel_files:
+    if first_file is None:
         result['output'].append(f"  ⚠ No Excel files found in INPUT folder")
         result['warnings'].append("No input files to test")
         result['passed'] = False
         return result
 
-    result['output'].append(f"  ✓ Found {len(excel_files)} Excel file(s)")
+    file_count = 1 + sum(1 for _ in excel_files)
+    result['output'].append(f"  ✓ Found {file_count} Excel file(s)")
 
     # Test first file structure
-    first_file = excel_files[0]
     result['output'].append(f"  Testing structure of: {os.path.basename(first_file)}")
 
     try:
-        df = pd.read_excel(first_file, engine='openpyxl')
-        result['output'].append(f"    ✓ File loaded successfully with {len(df)} rows")
+        # The header and first row are all that is inspected
+        df = read_excel_cached(first_file, nrows=1)
+        row_count = count_data_rows(first_file)
+        result['output'].append(f"    ✓ File loaded successfully with {row_count} rows")
 
         # Check for required columns
         required_cols = [SEQ_NO_COLUMN, TITLE_COLUMN, PLANNED_MHRS_COLUMN]
-        missing = [col for col in required_cols if col not in df.columns]
+        col_set = set(df.columns)
+        missing = [col for col in required_cols if col not in col_set]
 
         if missing:
             result['output'].append(f"    ⚠ Missing columns: {missing}")
@@ -298,10 +438,11 @@ def generate_debug_sample(file_path, output_path):
         output_path (str): Path to save debug output
     """
     try:
-        df = pd.read_excel(file_path, engine='openpyxl')
+        df = read_excel_cached(file_path)
 
         required_cols = [SEQ_NO_COLUMN, PLANNED_MHRS_COLUMN]
-        if not all(col in df.columns for col in required_cols):
+        col_set = set(df.columns)
+        if not all(col in col_set for col in required_cols):
             print(f"ERROR: Missing required columns for debug sample")
             return
 
@@ -309,22 +450,24 @@ def generate_debug_sample(file_path, output_path):
         sample_size = min(5, len(df))
         random_sample = df.sample(n=sample_size, random_state=1)
 
-        # Write debug output
+        # Build the whole report, then write it in one call
+        lines = [
+            "DEBUG SAMPLE REPORT (Random 5 Rows):",
+            f"Sample Size: {sample_size}",
+            "-" * 80,
+            f"| {'SEQ No.':<8} | {'Original Planned Mhrs':<21} | {'Parsed (HH:MM)':<12} |",
+            "-" * 80,
+        ]
+        # Convert the whole sampled column at once rather than row by row
+        parsed_hhmm = hours_to_hhmm_series(convert_planned_mhrs_series(random_sample[PLANNED_MHRS_COLUMN]))
+        for seq_value, mhrs_value, planned_time_hhmm in zip(random_sample[SEQ_NO_COLUMN],
+                                                             random_sample[PLANNED_MHRS_COLUMN],
+                                                             parsed_hhmm):
+            lines.append(f"| {str(seq_value):<8} | {str(mhrs_value):<21} | {planned_time_hhmm:>12} |")
+        lines.append("-" * 80)
+
         with open(output_path, "w", encoding="utf-8") as f:
-            f.write("DEBUG SAMPLE REPORT (Random 5 Rows):\n")
-            f.write(f"Sample Size: {sample_size}\n")
-            f.write("-" * 80 + "\n")
-            f.write(f"| {'SEQ No.':<8} | {'Original Planned Mhrs':<21} | {'Parsed (HH:MM)':<12} |\n")
-            f.write("-" * 80 + "\n")
-
-            for index, row in random_sample.iterrows():
-                seq_no = str(row[SEQ_NO_COLUMN])
-                original_mhrs = str(row[PLANNED_MHRS_COLUMN])
-                planned_hours = convert_planned_mhrs(row[PLANNED_MHRS_COLUMN])
-                planned_time_hhmm = hours_to_hhmm(planned_hours)
-                f.write(f"| {seq_no:<8} | {original_mhrs:<21} | {planned_time_hhmm:>12} |\n")
-
-            f.write("-" * 80 + "\n")
+            f.write("\n".join(lines) + "\n")
 
         print(f"Debug sample saved to {output_path}")
 
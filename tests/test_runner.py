@@ -3,8 +3,10 @@ Test Runner Module
 Unified test orchestration with comprehensive logging
 """
 
-import os
-from datetime import datetime
+import sys
+import time
+from functools import lru_cache
+from utils.logger import log_root
 from .test_config import test_config
 from .test_coefficients import test_coefficients
 from .test_tool_control import test_tool_control
@@ -14,6 +16,8 @@ from .test_data_quality import test_data_quality
 class TestResult:
     """Class to track test results"""
 
+    __slots__ = ('test_name', 'passed', 'failed', 'errors', 'warnings', 'output', '_status', '_symbol')
+
     def __init__(self, test_name):
         self.test_name = test_name
         self.passed = False
@@ -21,29 +25,47 @@ class TestResult:
         self.errors = []
         self.warnings = []
         self.output = []
+        self._status = "NOT RUN"
+        self._symbol = "✗"
+
+    def _update_status(self):
+        # Status only changes here, so get_status() is a plain attribute read.
+        # Add warnings through add_warning(s) so this stays in sync.
+        self._symbol = "✓" if self.passed else "✗"
+        if self.failed:
+            self._status = "FAILED"
+        elif self.warnings:
+            self._status = "PASSED (with warnings)"
+        elif self.passed:
+            self._status = "PASSED"
+        else:
+            self._status = "NOT RUN"
 
     def mark_passed(self):
         self.passed = True
+        self._update_status()
 
     def mark_failed(self, error_msg):
         self.failed = True
         self.errors.append(error_msg)
+        self._update_status()
 
     def add_warning(self, warning_msg):
         self.warnings.append(warning_msg)
+        self._update_status()
+
+    def add_warnings(self, warning_msgs):
+        self.warnings.extend(warning_msgs)
+        self._update_status()
 
     def add_output(self, output_msg):
         self.output.append(output_msg)
 
     def get_status(self):
-        if self.failed:
-            return "FAILED"
-        elif self.warnings:
-            return "PASSED (with warnings)"
-        elif self.passed:
-            return "PASSED"
-        else:
-            return "NOT RUN"
+        return self._status
+
+    def get_symbol(self):
+        return self._symbol
 
 
 def run_all_tests(save_log=True, verbose=True):
@@ -57,57 +79,58 @@ def run_all_tests(save_log=True, verbose=True):
     Returns:
         dict: Dictionary with test results
     """
-    print("=" * 80)
-    print("RUNNING COMPREHENSIVE TEST SUITE")
-    print("=" * 80)
-    print()
+    sys.stdout.write("=" * 80 + "\nRUNNING COMPREHENSIVE TEST SUITE\n" + "=" * 80 + "\n\n")
+
+    tests = [
+        ("Test 1: Configuration Validation", test_config, "Configuration"),
+        ("Test 2: Coefficient Functionality", test_coefficients, "Coefficients"),
+        ("Test 3: Tool Control Functionality", test_tool_control, "Tool Control"),
+        ("Test 4: Data Quality Checks", test_data_quality, "Data Quality"),
+    ]
 
     results = []
+    for title, test_func, test_name in tests:
+        print(title)
+        print("-" * 80)
+        results.append(run_test_with_capture(test_func, test_name, verbose))
+        print()
 
-    # Test 1: Configuration
-    print("Test 1: Configuration Validation")
-    print("-" * 80)
-    result = run_test_with_capture(test_config, "Configuration", verbose)
-    results.append(result)
-    print()
-
-    # Test 2: Coefficients
-    print("Test 2: Coefficient Functionality")
-    print("-" * 80)
-    result = run_test_with_capture(test_coefficients, "Coefficients", verbose)
-    results.append(result)
-    print()
-
-    # Test 3: Tool Control
-    print("Test 3: Tool Control Functionality")
-    print("-" * 80)
-    result = run_test_with_capture(test_tool_control, "Tool Control", verbose)
-    results.append(result)
-    print()
-
-    # Test 4: Data Quality
-    print("Test 4: Data Quality Checks")
-    print("-" * 80)
-    result = run_test_with_capture(test_data_quality, "Data Quality", verbose)
-    results.append(result)
-    print()
+    # Tally once and share the counts with the summary and the log
+    passed, failed = count_results(results)
 
     # Print summary
-    print_test_summary(results)
+    print_test_summary(results, passed, failed)
 
     # Save log if requested
     if save_log:
-        save_test_log(results)
+        save_test_log(results, passed, failed)
 
     return {
         'results': results,
-        'all_passed': all(r.passed for r in results),
+        'all_passed': passed == len(results),
         'total_tests': len(results),
-        'passed': sum(1 for r in results if r.passed),
-        'failed': sum(1 for r in results if r.failed)
+        'passed': passed,
+        'failed': failed
     }
 
 
+def count_results(results):
+    """
+    Count passed and failed tests in one pass.
+
+    Args:
+        results (list): List of TestResult objects
+
+    Returns:
+        tuple: (passed, failed)
+    """
+    passed = failed = 0
+    for result in results:
+        passed += result.passed
+        failed += result.failed
+    return passed, failed
+
+
 def run_test_with_capture(test_func, test_name, verbose=True):
     """
     Run a test function and capture its output.
@@ -133,13 +156,9 @@ def run_test_with_capture(test_func, test_name, verbose=True):
             else:
                 result.mark_failed(test_output.get('error', 'Test failed'))
 
-            # Capture warnings
-            for warning in test_output.get('warnings', []):
-                result.add_warning(warning)
-
-            # Capture output
-            for output in test_output.get('output', []):
-                result.add_output(output)
+            # Capture warnings and output in one step each
+            result.add_warnings(test_output.get('warnings', []))
+            result.output.extend(test_output.get('output', []))
         else:
             # If test just runs without errors, mark as passed
             result.mark_passed()
@@ -155,117 +174,121 @@ def run_test_with_capture(test_func, test_name, verbose=True):
     return result
 
 
-def print_test_summary(results):
+def print_test_summary(results, passed=None, failed=None):
     """
     Print a summary of all test results.
 
     Args:
         results (list): List of TestResult objects
+        passed (int): Number of passed tests (counted from results if omitted)
+        failed (int): Number of failed tests (counted from results if omitted)
     """
-    print("=" * 80)
-    print("TEST SUMMARY")
-    print("=" * 80)
-    print()
+    if passed is None or failed is None:
+        passed, failed = count_results(results)
 
-    for result in results:
-        status_symbol = "✓" if result.passed else "✗"
-        status = result.get_status()
-        print(f"{status_symbol} {result.test_name}: {status}")
+    lines = ["=" * 80, "TEST SUMMARY", "=" * 80, ""]
 
-        if result.errors:
-            for error in result.errors:
-                print(f"  ERROR: {error}")
+    for result in results:
+        lines.append(f"{result.get_symbol()} {result.test_name}: {result.get_status()}")
+        lines.extend(f"  ERROR: {error}" for error in result.errors)
+        lines.extend(f"  WARNING: {warning}" for warning in result.warnings)
 
-        if result.warnings:
-            for warning in result.warnings:
-                print(f"  WARNING: {warning}")
+    lines.append("")
+    lines.append("-" * 80)
+    lines.append(f"Total Tests: {len(results)}")
+    lines.append(f"Passed: {passed}")
+    lines.append(f"Failed: {failed}")
+    lines.append("")
 
-    print()
-    print("-" * 80)
+    if failed == 0:
+        lines.append("✓ ALL TESTS PASSED!")
+    else:
+        lines.append("✗ SOME TESTS FAILED - Please review errors above")
 
-    total = len(results)
-    passed = sum(1 for r in results if r.passed)
-    failed = sum(1 for r in results if r.failed)
+    lines.append("=" * 80)
 
-    print(f"Total Tests: {total}")
-    print(f"Passed: {passed}")
-    print(f"Failed: {failed}")
+    # One write for the whole summary instead of a print per line
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
-    if failed == 0:
-        print()
-        print("✓ ALL TESTS PASSED!")
-    else:
-        print()
-        print("✗ SOME TESTS FAILED - Please review errors above")
 
-    print("=" * 80)
+@lru_cache(maxsize=1)
+def _test_log_dir():
+    """LOG/tests under the working directory, created on first use only."""
+    log_dir = log_root() / 'tests'
+    log_dir.mkdir(exist_ok=True)
+    return log_dir
 
 
-def save_test_log(results):
+def save_test_log(results, passed=None, failed=None):
     """
     Save test results to LOG folder.
 
     Args:
         results (list): List of TestResult objects
+        passed (int): Number of passed tests (counted from results if omitted)
+        failed (int): Number of failed tests (counted from results if omitted)
     """
-    # Create LOG/tests folder
-    log_folder = os.path.join(os.getcwd(), 'LOG', 'tests')
-    os.makedirs(log_folder, exist_ok=True)
+    if passed is None or failed is None:
+        passed, failed = count_results(results)
 
     # Create log file with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file_path = os.path.join(log_folder, f"test_results_{timestamp}.txt")
-
-    with open(log_file_path, "w", encoding="utf-8") as f:
-        f.write("=" * 80 + "\n")
-        f.write("COMPREHENSIVE TEST RESULTS\n")
-        f.write("=" * 80 + "\n")
-        f.write(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write("\n")
-
-        # Write individual test results
-        for result in results:
-            f.write("-" * 80 + "\n")
-            f.write(f"TEST: {result.test_name}\n")
-            f.write(f"STATUS: {result.get_status()}\n")
-            f.write("-" * 80 + "\n")
-
-            if result.output:
-                f.write("\nOutput:\n")
-                for output in result.output:
-                    f.write(f"  {output}\n")
-
-            if result.errors:
-                f.write("\nErrors:\n")
-                for error in result.errors:
-                    f.write(f"  ✗ {error}\n")
-
-            if result.warnings:
-                f.write("\nWarnings:\n")
-                for warning in result.warnings:
-                    f.write(f"  ⚠ {warning}\n")
-
-            f.write("\n")
-
-        # Write summary
-        f.write("=" * 80 + "\n")
-        f.write("SUMMARY\n")
-        f.write("=" * 80 + "\n")
-
-        total = len(results)
-        passed = sum(1 for r in results if r.passed)
-        failed = sum(1 for r in results if r.failed)
-
-        f.write(f"Total Tests: {total}\n")
-        f.write(f"Passed: {passed}\n")
-        f.write(f"Failed: {failed}\n")
-
-        if failed == 0:
-            f.write("\n✓ ALL TESTS PASSED!\n")
-        else:
-            f.write("\n✗ SOME TESTS FAILED\n")
+    now = time.localtime()
+    timestamp = time.strftime("%Y%m%d_%H%M%S", now)
+    log_file_path = _test_log_dir() / f"test_results_{timestamp}.txt"
+
+    # Build the whole log in memory and write it in one call
+    parts = [
+        "=" * 80 + "\n",
+        "COMPREHENSIVE TEST RESULTS\n",
+        "=" * 80 + "\n",
+        f"Test Date: {time.strftime('%Y-%m-%d %H:%M:%S', now)}\n",
+        "\n",
+    ]
+
+    # Individual test results
+    for result in results:
+        parts.append("-" * 80 + "\n")
+        parts.append(f"TEST: {result.test_name}\n")
+        parts.append(f"STATUS: {result.get_status()}\n")
+        parts.append("-" * 80 + "\n")
 
-        f.write("=" * 80 + "\n")
+        if result.output:
+            parts.append("\nOutput:\n")
+            parts.extend(f"  {output}\n" for output in result.output)
+
+        if result.errors:
+            parts.append("\nErrors:\n")
+            parts.extend(f"  ✗ {error}\n" for error in result.errors)
+
+        if result.warnings:
+            parts.append("\nWarnings:\n")
+            parts.extend(f"  ⚠ {warning}\n" for warning in result.warnings)
+
+        parts.append("\n")
+
+    # Summary
+    parts.append("=" * 80 + "\n")
+    parts.append("SUMMARY\n")
+    parts.append("=" * 80 + "\n")
+    parts.append(f"Total Tests: {len(results)}\n")
+    parts.append(f"Passed: {passed}\n")
+    parts.append(f"Failed: {failed}\n")
+
+    if failed == 0:
+        parts.append("\n✓ ALL TESTS PASSED!\n")
+    else:
+        parts.append("\n✗ SOME TESTS FAILED\n")
+
+    parts.append("=" * 80 + "\n")
+
+    log_text = "".join(parts)
+    try:
+        log_file_path.write_text(log_text, encoding="utf-8")
+    except FileNotFoundError:
+        # LOG/tests was removed since it was first created
+        log_file_path.parent.mkdir(parents=True, exist_ok=True)
+        log_file_path.write_text(log_text, encoding="utf-8")
 
     print(f"\nTest log saved to: {log_file_path}")
 
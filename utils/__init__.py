@@ -4,23 +4,34 @@ Contains common utility functions used across the project
 UPDATED: Now exports logging functions
 """
 
-from .time_utils import hours_to_hhmm, convert_planned_mhrs, time_to_hours
+from .time_utils import (
+    hours_to_hhmm,
+    hours_to_hhmm_series,
+    convert_planned_mhrs,
+    convert_planned_mhrs_series,
+    time_to_hours
+)
 from .validation import validate_required_columns, check_column_exists
 from .formatters import clean_string, format_percentage
+from .excel_utils import read_excel_fast, read_excel_sheets_cached, EXCEL_READ_ENGINE, EXCEL_WRITE_ENGINE
 from .logger import (
     WorkpackLogger,
+    get_workpack_logger,
     get_logger,
     info,
     debug,
     warning,
     error,
-    critical
+    critical,
+    flush_logs
 )
 
 __all__ = [
     # Time utilities
     'hours_to_hhmm',
+    'hours_to_hhmm_series',
     'convert_planned_mhrs',
+    'convert_planned_mhrs_series',
     'time_to_hours',
 
     # Validation utilities
@@ -31,12 +42,20 @@ __all__ = [
     'clean_string',
     'format_percentage',
 
+    # Excel utilities
+    'read_excel_fast',
+    'read_excel_sheets_cached',
+    'EXCEL_READ_ENGINE',
+    'EXCEL_WRITE_ENGINE',
+
     # Logging utilities
     'WorkpackLogger',
+    'get_workpack_logger',
     'get_logger',
     'info',
     'debug',
     'warning',
     'error',
     'critical',
+    'flush_logs',
 ]
\ No newline at end of file
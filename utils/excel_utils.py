@@ -0,0 +1,65 @@
+"""
+Excel Utilities Module
+Handles reading Excel workbooks and picks the fastest available read/write engines
+"""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+# python-calamine (Rust-backed) parses .xlsx several times faster than openpyxl.
+# It is optional - fall back to openpyxl when it is not installed.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_READ_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_READ_ENGINE = 'openpyxl'
+
+# XlsxWriter writes .xlsx files several times faster than openpyxl. It is
+# optional - fall back to openpyxl when it is not installed.
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_WRITE_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_WRITE_ENGINE = 'openpyxl'
+
+
+def read_excel_fast(path, **kwargs):
+    """
+    Read an Excel file into a DataFrame using the fastest available engine.
+
+    Args:
+        path (str): Path to the Excel file
+        **kwargs: Extra arguments passed through to pd.read_excel
+
+    Returns:
+        pd.DataFrame: Loaded DataFrame
+    """
+    return pd.read_excel(path, engine=EXCEL_READ_ENGINE, **kwargs)
+
+
+@lru_cache(maxsize=16)
+def _read_excel_sheets(path, mtime_ns, size):
+    """Parse every sheet of a workbook; keyed on file stats so edits invalidate."""
+    with pd.ExcelFile(path, engine=EXCEL_READ_ENGINE) as excel_file:
+        return {sheet_name: excel_file.parse(sheet_name)
+                for sheet_name in excel_file.sheet_names}
+
+
+def read_excel_sheets_cached(path):
+    """
+    Read all sheets of a reference workbook, parsing it at most once per run.
+
+    The workbook is re-parsed only when its modification time or size
+    changes. The returned DataFrames are shared between callers and must
+    be treated as read-only.
+
+    Args:
+        path (str): Path to the Excel file
+
+    Returns:
+        dict: Mapping of sheet name to DataFrame, in workbook order
+    """
+    stat = os.stat(path)
+    return _read_excel_sheets(path, stat.st_mtime_ns, stat.st_size)
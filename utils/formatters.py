@@ -6,6 +6,22 @@ Handles string formatting, cleaning, and display formatting
 import pandas as pd
 
 
+def _is_missing(value):
+    """
+    Scalar pd.isna() with fast paths for the common cases.
+
+    Strings and floats are checked directly (NaN is the only float that is
+    not equal to itself); anything else goes through pd.isna().
+    """
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return False
+    if isinstance(value, float):
+        return value != value
+    return pd.isna(value)
+
+
 def clean_string(value):
     """
     Cleans a string value by removing extra whitespace and handling None/NaN.
@@ -22,7 +38,9 @@ def clean_string(value):
         >>> clean_string(None)
         ''
     """
-    if pd.isna(value) or value is None:
+    if isinstance(value, str):
+        return value.strip()
+    if _is_missing(value):
         return ""
 
     return str(value).strip()
@@ -45,7 +63,7 @@ def format_percentage(value, decimal_places=1):
         >>> format_percentage(0.5, 2)
         '50.00%'
     """
-    if pd.isna(value):
+    if _is_missing(value):
         return "0.0%"
 
     percentage = value * 100
@@ -92,7 +110,7 @@ def format_seq_display(seq_value):
         >>> format_seq_display('3.45')
         '3.45'
     """
-    if pd.isna(seq_value):
+    if _is_missing(seq_value):
         return "N/A"
 
     return str(seq_value).strip()
@@ -114,7 +132,7 @@ def format_task_id_display(task_id):
         >>> format_task_id_display(None)
         '(No ID)'
     """
-    if pd.isna(task_id) or str(task_id).lower() == 'nan':
+    if _is_missing(task_id) or str(task_id).lower() == 'nan':
         return "(No ID)"
 
     return str(task_id).strip()
@@ -136,7 +154,7 @@ def format_special_code_display(special_code):
         >>> format_special_code_display(None)
         '(No Code)'
     """
-    if pd.isna(special_code):
+    if _is_missing(special_code):
         return "(No Code)"
 
     code_str = str(special_code).strip()
@@ -163,7 +181,7 @@ def format_tool_type(tool_type_value):
         >>> format_tool_type('N')
         'Spare'
     """
-    if pd.isna(tool_type_value):
+    if _is_missing(tool_type_value):
         return 'Unknown'
 
     val_str = str(tool_type_value).strip().upper()
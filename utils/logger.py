@@ -3,38 +3,178 @@ Centralized Logging System
 Provides a unified logging interface for the entire application
 """
 
+import atexit
 import logging
 import os
+from collections import OrderedDict
+from functools import lru_cache
+import threading
+import time
+import weakref
 from datetime import datetime
 from pathlib import Path
 
+# Log files are written through a 64 KiB buffer and flushed every second
+# (and at exit) instead of after every record. Set WORKPACK_LOG_UNBUFFERED=1
+# to go back to a plain FileHandler that flushes each record.
+LOG_BUFFER_SIZE = 65536
+LOG_FLUSH_INTERVAL = 1.0
+
+
+def _log_unbuffered():
+    """Whether WORKPACK_LOG_UNBUFFERED asks for per-record flushing."""
+    return os.environ.get('WORKPACK_LOG_UNBUFFERED', '').strip().lower() not in ('', '0', 'false', 'no')
+
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    File handler that leaves flushing to a background timer.
+
+    Records go into the file object's write buffer; the buffer is written
+    out every LOG_FLUSH_INTERVAL seconds, when it fills up, and on close.
+    """
+
+    _open_handlers = weakref.WeakSet()
+    _flush_thread = None
+    _flush_lock = threading.Lock()
+
+    def __init__(self, filename, mode='a', encoding='utf-8'):
+        self.baseFilename = os.path.abspath(filename)
+        stream = open(self.baseFilename, mode, encoding=encoding, buffering=LOG_BUFFER_SIZE)
+        super().__init__(stream)
+        self._open_handlers.add(self)
+        self._start_flush_thread()
+
+    def emit(self, record):
+        """Write the record without flushing; see _flush_loop."""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            stream = self.stream
+            if stream:
+                try:
+                    self.flush()
+                finally:
+                    self.stream = None
+                    stream.close()
+        finally:
+            self.release()
+            super().close()
+
+    @classmethod
+    def flush_all(cls):
+        """Flush every open buffered handler."""
+        for handler in list(cls._open_handlers):
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
+    @classmethod
+    def _start_flush_thread(cls):
+        with cls._flush_lock:
+            # A forked worker process inherits the thread object but not the
+            # running thread, so start a new one there
+            if cls._flush_thread is None or not cls._flush_thread.is_alive():
+                cls._flush_thread = threading.Thread(target=cls._flush_loop,
+                                                     name="log-flush", daemon=True)
+                cls._flush_thread.start()
+
+    @classmethod
+    def _flush_loop(cls):
+        while True:
+            time.sleep(LOG_FLUSH_INTERVAL)
+            cls.flush_all()
+
+
+# Make sure buffered records reach disk even if logging.shutdown is not run
+atexit.register(BufferedFileHandler.flush_all)
+
+# Empty the buffers before forking so a child process does not inherit
+# (and later write out a second copy of) records the parent already logged
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=BufferedFileHandler.flush_all)
+
+
+def flush_logs():
+    """
+    Write out all buffered log records now.
+
+    Worker processes exit without running atexit hooks, so they call this
+    before returning to make sure their log output reaches disk.
+    """
+    BufferedFileHandler.flush_all()
+
+
+@lru_cache(maxsize=1)
+def log_root():
+    """
+    LOG folder under the working directory, created and resolved on first use.
+
+    Returns:
+        Path: The LOG folder
+    """
+    root = Path.cwd() / 'LOG'
+    root.mkdir(exist_ok=True)
+    return root
+
+
+@lru_cache(maxsize=1)
+def _main_logger():
+    """The 'workpack_main' logger, looked up once."""
+    return logging.getLogger('workpack_main')
+
+
+@lru_cache(maxsize=256)
+def _module_logger(module_name):
+    """Module logger by name, memoized to skip the name building and manager lookup."""
+    return logging.getLogger("workpack." + module_name)
+
+
+def _create_file_handler(log_file):
+    """File handler for log_file, buffered unless WORKPACK_LOG_UNBUFFERED is set."""
+    if _log_unbuffered():
+        return logging.FileHandler(log_file, encoding='utf-8')
+    return BufferedFileHandler(log_file, encoding='utf-8')
+
 
 class WorkpackLogger:
     """
     Centralized logger for the workpack processing system.
     Provides both file and console logging with different levels.
+
+    There is one instance per process; get it with get_workpack_logger()
+    rather than constructing the class, which would set up the log files again.
     """
 
-    _instance = None
-    _loggers = {}
+    # Most file loggers kept open at once; the least recently used one is
+    # closed when another is created past this limit
+    MAX_CACHED_LOGGERS = 128
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(WorkpackLogger, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    _loggers = OrderedDict()
 
     def __init__(self):
-        if self._initialized:
-            return
-        self._initialized = True
         self._setup_logging()
 
     def _setup_logging(self):
         """Setup the logging configuration"""
         # Create LOG directory
-        self.log_dir = Path(os.getcwd()) / 'LOG'
-        self.log_dir.mkdir(exist_ok=True)
+        self.log_dir = log_root()
 
         # Create main application logger
         self.main_logger = self._create_logger(
@@ -59,10 +199,11 @@ class WorkpackLogger:
         logger.setLevel(level)
 
         # Remove existing handlers to avoid duplicates
-        logger.handlers = []
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
 
         # File handler - detailed logging
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = _create_file_handler(log_file)
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
@@ -101,6 +242,7 @@ class WorkpackLogger:
 
         # Return existing logger if available
         if logger_name in self._loggers:
+            self._loggers.move_to_end(logger_name)
             return self._loggers[logger_name]
 
         # Create file-specific log directory
@@ -116,6 +258,12 @@ class WorkpackLogger:
         )
 
         self._loggers[logger_name] = logger
+
+        # Close the least recently used file loggers beyond the cap
+        while len(self._loggers) > self.MAX_CACHED_LOGGERS:
+            oldest_name = next(iter(self._loggers))
+            self._close_logger(oldest_name)
+
         return logger
 
     def get_module_logger(self, module_name):
@@ -128,37 +276,42 @@ class WorkpackLogger:
         Returns:
             logging.Logger: Module-specific logger
         """
-        return logging.getLogger(f"workpack.{module_name}")
+        return _module_logger(module_name)
 
     @staticmethod
-    def info(message, **kwargs):
-        """Log info message to main logger"""
-        logger = logging.getLogger('workpack_main')
-        logger.info(message, **kwargs)
+    def info(message, *args, **kwargs):
+        """Log info message to main logger (args are %-formatted only if emitted)"""
+        logger = _main_logger()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(message, *args, **kwargs)
 
     @staticmethod
-    def debug(message, **kwargs):
-        """Log debug message to main logger"""
-        logger = logging.getLogger('workpack_main')
-        logger.debug(message, **kwargs)
+    def debug(message, *args, **kwargs):
+        """Log debug message to main logger (args are %-formatted only if emitted)"""
+        logger = _main_logger()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message, *args, **kwargs)
 
     @staticmethod
-    def warning(message, **kwargs):
-        """Log warning message to main logger"""
-        logger = logging.getLogger('workpack_main')
-        logger.warning(message, **kwargs)
+    def warning(message, *args, **kwargs):
+        """Log warning message to main logger (args are %-formatted only if emitted)"""
+        logger = _main_logger()
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(message, *args, **kwargs)
 
     @staticmethod
-    def error(message, **kwargs):
-        """Log error message to main logger"""
-        logger = logging.getLogger('workpack_main')
-        logger.error(message, **kwargs)
+    def error(message, *args, **kwargs):
+        """Log error message to main logger (args are %-formatted only if emitted)"""
+        logger = _main_logger()
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(message, *args, **kwargs)
 
     @staticmethod
-    def critical(message, **kwargs):
-        """Log critical message to main logger"""
-        logger = logging.getLogger('workpack_main')
-        logger.critical(message, **kwargs)
+    def critical(message, *args, **kwargs):
+        """Log critical message to main logger (args are %-formatted only if emitted)"""
+        logger = _main_logger()
+        if logger.isEnabledFor(logging.CRITICAL):
+            logger.critical(message, *args, **kwargs)
 
     def log_separator(self, logger=None, char="=", length=80):
         """Log a separator line"""
@@ -176,14 +329,27 @@ class WorkpackLogger:
 
     def close_file_logger(self, base_filename):
         """Close and remove a file-specific logger"""
-        logger_name = f"workpack_{base_filename}"
-        if logger_name in self._loggers:
-            logger = self._loggers[logger_name]
+        self._close_logger(f"workpack_{base_filename}")
+
+    def _close_logger(self, logger_name):
+        """Close the handlers of a cached file logger and forget it"""
+        logger = self._loggers.pop(logger_name, None)
+        if logger is not None:
             # Close all handlers
             for handler in logger.handlers[:]:
                 handler.close()
                 logger.removeHandler(handler)
-            del self._loggers[logger_name]
+
+
+@lru_cache(maxsize=1)
+def get_workpack_logger():
+    """
+    The shared WorkpackLogger, constructed on first use.
+
+    Returns:
+        WorkpackLogger: The process-wide logger instance
+    """
+    return WorkpackLogger()
 
 
 # Convenience functions for quick logging
@@ -198,7 +364,7 @@ def get_logger(module_name=None, base_filename=None):
     Returns:
         logging.Logger: Appropriate logger
     """
-    wl = WorkpackLogger()
+    wl = get_workpack_logger()
 
     if base_filename:
         return wl.get_file_logger(base_filename)
@@ -208,35 +374,35 @@ def get_logger(module_name=None, base_filename=None):
         return wl.main_logger
 
 
-def info(message):
+def info(message, *args):
     """Quick info logging"""
-    WorkpackLogger.info(message)
+    WorkpackLogger.info(message, *args)
 
 
-def debug(message):
+def debug(message, *args):
     """Quick debug logging"""
-    WorkpackLogger.debug(message)
+    WorkpackLogger.debug(message, *args)
 
 
-def warning(message):
+def warning(message, *args):
     """Quick warning logging"""
-    WorkpackLogger.warning(message)
+    WorkpackLogger.warning(message, *args)
 
 
-def error(message):
+def error(message, *args):
     """Quick error logging"""
-    WorkpackLogger.error(message)
+    WorkpackLogger.error(message, *args)
 
 
-def critical(message):
+def critical(message, *args):
     """Quick critical logging"""
-    WorkpackLogger.critical(message)
+    WorkpackLogger.critical(message, *args)
 
 
 # Example usage in different contexts:
 """
 # In main.py:
-from utils.logger import WorkpackLogger, info, error
+from utils.logger import info, error
 
 info("Starting workpack processing")
 error("Failed to load file")
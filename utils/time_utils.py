@@ -3,8 +3,35 @@ Time Utilities Module
 Handles all time-related conversions and formatting
 """
 
+import re
+import time
+
+import numpy as np
 import pandas as pd
 from datetime import timedelta
+from functools import lru_cache
+
+# numba is optional - when installed, very large columns are formatted by a
+# compiled parallel kernel instead of numpy.char
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many rows the numpy path is faster than dispatching to numba
+_NUMBA_MIN_ROWS = 50_000
+
+
+# "00".."99", so formatting HH:MM is two table lookups instead of two format specs
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+
+
+@lru_cache(maxsize=4096)
+def _hhmm_cached(total_minutes):
+    """Format a whole number of minutes as HH:MM (memoized, inputs repeat a lot)."""
+    h, m = divmod(total_minutes, 60)
+    return (_PAD2[h] if h < 100 else str(h)) + ":" + _PAD2[m]
 
 
 def hours_to_hhmm(hours):
@@ -26,11 +53,54 @@ def hours_to_hhmm(hours):
     if hours < 0:
         return "00:00"
 
-    total_minutes = int(round(hours * 60))
-    h = total_minutes // 60
-    m = total_minutes % 60
+    return _hhmm_cached(int(round(hours * 60)))
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _hhmm_kernel(total_minutes, out):
+        """Write each minute count as fixed-width ASCII HH:MM into out (n x 5 uint8)."""
+        for i in prange(total_minutes.size):
+            h = total_minutes[i] // 60
+            m = total_minutes[i] % 60
+            out[i, 0] = 48 + h // 10
+            out[i, 1] = 48 + h % 10
+            out[i, 2] = 58  # ':'
+            out[i, 3] = 48 + m // 10
+            out[i, 4] = 48 + m % 10
+
+
+def hours_to_hhmm_series(hours):
+    """
+    Vectorized hours_to_hhmm() for a whole column of hours.
+
+    Negative and blank values are shown as "00:00".
+
+    Args:
+        hours (pd.Series): Total hours (can be decimal)
 
-    return f"{h:02d}:{m:02d}"
+    Returns:
+        pd.Series: HH:MM strings, same index as the input
+    """
+    values = np.asarray(hours, dtype=np.float64)
+    index = getattr(hours, 'index', None)
+    if values.size == 0:
+        return pd.Series([], index=index, dtype=object)
+
+    total_minutes = np.rint(np.nan_to_num(values) * 60).astype(np.int64)
+    total_minutes = np.where(values < 0, 0, total_minutes)
+
+    # The kernel writes exactly two hour digits, so it only handles < 100 hours
+    if (NUMBA_AVAILABLE and values.size >= _NUMBA_MIN_ROWS
+            and total_minutes.max() < 100 * 60):
+        out = np.empty((values.size, 5), dtype=np.uint8)
+        _hhmm_kernel(total_minutes, out)
+        hhmm = out.view('S5').ravel().astype('U5')
+    else:
+        h, m = np.divmod(total_minutes, 60)
+        hhmm = np.char.add(np.char.add(np.char.zfill(h.astype(str), 2), ':'),
+                           np.char.zfill(m.astype(str), 2))
+    return pd.Series(hhmm, index=index, dtype=object)
 
 
 def convert_planned_mhrs(time_val):
@@ -67,6 +137,27 @@ def convert_planned_mhrs(time_val):
     return 0.0
 
 
+def convert_planned_mhrs_series(values):
+    """
+    Vectorized convert_planned_mhrs() for a whole column of minutes.
+
+    Blank or non-numeric entries become 0.0, matching the scalar version.
+
+    Args:
+        values (pd.Series): Planned man-hours in minutes
+
+    Returns:
+        pd.Series: Hours as float, same index as the input
+    """
+    minutes = pd.to_numeric(values, errors='coerce')
+    return (minutes / 60.0).fillna(0.0).astype(float)
+
+
+# Whole-second "H:MM:SS" strings, the common case in Excel exports. Minutes
+# and seconds must be 00-59; anything else is left to pd.to_timedelta
+_HMS_RE = re.compile(r'([0-9]+):([0-5][0-9]):([0-5][0-9])')
+
+
 def time_to_hours(time_val):
     """
     Converts Excel time values (which may include days, e.g., '1 day 12:30:00')
@@ -105,17 +196,48 @@ def time_to_hours(time_val):
         else:
             return float(time_val)
 
-    # Handle string representations
-    try:
-        time_str = str(time_val).strip()
-        if time_str.count(':') >= 1:
-            return pd.to_timedelta(time_str).total_seconds() / 3600.0
-    except Exception:
-        pass
+    # Handle string representations; plain "H:MM:SS" is parsed directly,
+    # anything else (days, fractions, signs, out-of-range minutes or
+    # seconds) goes through pd.to_timedelta.
+    # Unparseable text coerces to NaT instead of raising.
+    time_str = str(time_val).strip()
+    match = _HMS_RE.fullmatch(time_str)
+    if match:
+        h, m, sec = match.groups()
+        return (int(h) * 3600 + int(m) * 60 + int(sec)) / 3600.0
+    if ':' in time_str:
+        parsed = pd.to_timedelta(time_str, errors='coerce')
+        if pd.notna(parsed):
+            return parsed.total_seconds() / 3600.0
 
     return 0.0
 
 
+# Last text produced per format by now_str(), as (epoch second, text)
+_now_cache = {}
+
+
+def now_str(fmt="%Y-%m-%d %H:%M:%S"):
+    """
+    Current local time formatted with fmt, reusing the text within the same second.
+
+    Only for formats with at most one-second resolution.
+
+    Args:
+        fmt (str): time.strftime format (default: "%Y-%m-%d %H:%M:%S")
+
+    Returns:
+        str: Formatted current time
+    """
+    now = int(time.time())
+    cached = _now_cache.get(fmt)
+    if cached is not None and cached[0] == now:
+        return cached[1]
+    text = time.strftime(fmt, time.localtime(now))
+    _now_cache[fmt] = (now, text)
+    return text
+
+
 def calculate_workpack_duration(start_date, end_date):
     """
     Calculate the duration of a workpack in days.
@@ -3,7 +3,10 @@ Validation Utilities Module
 Handles data validation, column checking, and data quality checks
 """
 
+import re
+
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype, is_timedelta64_dtype
 
 
 def validate_required_columns(df, required_columns, file_name="file"):
@@ -68,17 +71,20 @@ def validate_numeric_column(df, column_name, allow_na=True):
 
     column = df[column_name]
 
-    # Try converting to numeric
-    numeric_column = pd.to_numeric(column, errors='coerce')
-
-    # Find non-numeric values (excluding NaN if allowed)
-    if allow_na:
-        problematic = column[numeric_column.isna() & column.notna()]
+    if is_numeric_dtype(column):
+        # Already numeric - only missing values can be a problem
+        if allow_na:
+            return True, []
+        bad = column.isna().to_numpy()
     else:
-        problematic = column[numeric_column.isna()]
+        # Try converting to numeric
+        bad = pd.to_numeric(column, errors='coerce').isna().to_numpy()
+        # Find non-numeric values (excluding NaN if allowed)
+        if allow_na:
+            bad &= column.notna().to_numpy()
 
-    if len(problematic) > 0:
-        return False, problematic.index.tolist()
+    if bad.any():
+        return False, column.index[bad].tolist()
 
     return True, []
 
@@ -102,9 +108,14 @@ def check_empty_values(df, column_name, threshold=0.5):
     if total_rows == 0:
         return True, 0.0
 
-    # Count empty values (NaN, None, empty strings)
-    empty_count = df[column_name].isna().sum()
-    empty_count += (df[column_name].astype(str).str.strip() == '').sum()
+    # Count empty values (NaN, None, empty strings) in one combined mask
+    column = df[column_name]
+    empty = column.isna()
+    if not (is_numeric_dtype(column) or is_datetime64_any_dtype(column)
+            or is_timedelta64_dtype(column)):
+        # Only text-like columns can hold blank strings
+        empty |= column.astype(str).str.strip().eq('')
+    empty_count = empty.sum()
 
     empty_proportion = empty_count / total_rows
 
@@ -141,6 +152,13 @@ def validate_date_columns(df, start_col='Start_date', end_col='End_date'):
         return False, f"Error parsing dates: {e}"
 
 
+# One SEQ component the way int() accepts it: optional sign, digits with
+# optional underscores, surrounding whitespace
+_SEQ_PART = r'\s*[+-]?\d+(?:_\d+)*\s*'
+# "<major>.<minor>", optionally followed by further ".<anything>" parts
+_SEQ_RE = re.compile(_SEQ_PART + r'\.' + _SEQ_PART + r'(?:\..*)?', re.DOTALL)
+
+
 def validate_seq_format(seq_value):
     """
     Validates that a SEQ value follows the expected format (e.g., "2.1", "3.45").
@@ -154,22 +172,5 @@ def validate_seq_format(seq_value):
     if pd.isna(seq_value):
         return False
 
-    seq_str = str(seq_value).strip()
-
-    # Should contain at least one dot
-    if '.' not in seq_str:
-        return False
-
-    # Split and check parts are numeric
-    parts = seq_str.split('.')
-    if len(parts) < 2:
-        return False
-
-    try:
-        # Major version should be numeric
-        int(parts[0])
-        # Minor version should be numeric
-        int(parts[1])
-        return True
-    except ValueError:
-        return False
\ No newline at end of file
+    # Major and minor parts must both be numeric
+    return _SEQ_RE.fullmatch(str(seq_value).strip()) is not None
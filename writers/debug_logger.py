@@ -7,7 +7,8 @@ Now includes ALL debug output, not just sample data
 import os
 import pandas as pd
 from datetime import datetime
-from utils.time_utils import hours_to_hhmm
+from utils.logger import LOG_BUFFER_SIZE, log_root
+from utils.time_utils import hours_to_hhmm_series
 from core.config import SEQ_NO_COLUMN, TITLE_COLUMN
 
 
@@ -15,6 +16,10 @@ class DebugLogger:
     """
     Centralized debug logger that writes to both console and log file
     """
+
+    # Records written between flushes of the log file
+    FLUSH_EVERY = 100
+
     def __init__(self, base_filename, timestamp):
         """
         Initialize debug logger
@@ -27,19 +32,17 @@ class DebugLogger:
         self.timestamp = timestamp
         self.log_file_path = None
         self.log_file = None
+        self._pending = 0
 
     def __enter__(self):
         """Context manager entry - open log file"""
         # Create LOG folder structure
-        log_folder = os.path.join(os.getcwd(), 'LOG')
-        os.makedirs(log_folder, exist_ok=True)
-
-        file_log_folder = os.path.join(log_folder, self.base_filename)
-        os.makedirs(file_log_folder, exist_ok=True)
+        file_log_folder = create_log_folder_structure(self.base_filename)
 
         # Open log file for writing
         self.log_file_path = os.path.join(file_log_folder, f"debug_{self.timestamp}.txt")
-        self.log_file = open(self.log_file_path, "w", encoding="utf-8")
+        # Large buffer so consecutive records go out in few write() calls
+        self.log_file = open(self.log_file_path, "w", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
 
         return self
 
@@ -49,30 +52,51 @@ class DebugLogger:
             self.log_file.close()
             print(f"\n✓ Debug log saved to {self.log_file_path}")
 
-    def log(self, message, to_console=True):
+    def log(self, message, to_console=True, flush=False):
         """
         Write message to both log file and console
 
+        The file is flushed every FLUSH_EVERY records, when flush is True,
+        and on exit.
+
         Args:
             message: Message to write
             to_console: Whether to also print to console (default True)
+            flush: Whether to flush the log file right away (default False)
         """
         if self.log_file:
             self.log_file.write(message + "\n")
-            self.log_file.flush()  # Ensure immediate write
+            self._written(flush)
 
         if to_console:
             print(message)
 
+    def log_section(self, text):
+        """
+        Write a pre-built multi-line section to the log file in one call
+
+        Args:
+            text: Section text, e.g. from build_debug_sample_section()
+        """
+        if self.log_file:
+            self.log_file.write(text)
+            self._written(False)
+
+    def _written(self, flush):
+        """Count a write and flush once enough have piled up."""
+        self._pending += 1
+        if flush or self._pending >= self.FLUSH_EVERY:
+            self.log_file.flush()
+            self._pending = 0
+
     def log_separator(self, char="=", length=80):
         """Write a separator line"""
         self.log(char * length)
 
-    def log_header(self, title):
-        """Write a formatted header"""
-        self.log_separator()
-        self.log(title)
-        self.log_separator()
+    def log_header(self, title, char="=", length=80):
+        """Write a formatted header as one block (separator, title, separator)"""
+        separator = char * length
+        self.log(f"{separator}\n{title}\n{separator}")
 
 
 def save_debug_log(base_filename, timestamp, report_data):
@@ -80,107 +104,144 @@ def save_debug_log(base_filename, timestamp, report_data):
     Save debug information to LOG folder.
     This is called at the end to write the sample data.
 
+    Inside an open DebugLogger, use
+    logger.log_section(build_debug_sample_section(report_data)) instead, so
+    the file is written in the same pass rather than reopened for append.
+
     Args:
         base_filename (str): Base name of input file
         timestamp (str): Timestamp string
         report_data (dict): Dictionary containing processed data
     """
-    # Create LOG folder in root directory
-    log_folder = os.path.join(os.getcwd(), 'LOG')
-    os.makedirs(log_folder, exist_ok=True)
-
-    # Create subfolder for this file
-    file_log_folder = os.path.join(log_folder, base_filename)
-    os.makedirs(file_log_folder, exist_ok=True)
+    # LOG/<base_filename> in the working directory
+    file_log_folder = create_log_folder_structure(base_filename)
 
     # Define log file path - append to existing file
     log_file_path = os.path.join(file_log_folder, f"debug_{timestamp}.txt")
 
-    # Append debug information
-    with open(log_file_path, "a", encoding="utf-8") as f:
-        write_debug_sample(f, report_data)
+    # Append debug information: encode the whole section once and write the
+    # bytes in one call, with the line endings text mode would have produced
+    section = build_debug_sample_section(report_data)
+    if os.linesep != "\n":
+        section = section.replace("\n", os.linesep)
+    with open(log_file_path, "ab") as f:
+        f.write(section.encode("utf-8"))
 
 
-def write_debug_sample(f, report_data):
+def build_debug_sample_section(report_data):
     """
-    Write the debug sample section showing random rows.
+    Build the debug sample section showing random rows.
 
     Args:
-        f: File object
         report_data (dict): Dictionary containing processed data
+
+    Returns:
+        str: The complete section text
     """
     debug_df = report_data['debug_sample']
+    out = []
 
-    f.write("\n\n")
-    f.write("=" * 80 + "\n")
-    f.write("DEBUG SAMPLE REPORT\n")
-    f.write("=" * 80 + "\n")
+    out.append("\n\n")
+    out.append("=" * 80 + "\n")
+    out.append("DEBUG SAMPLE REPORT\n")
+    out.append("=" * 80 + "\n")
 
     if len(debug_df) == 0:
-        f.write("No data to display (all rows were ignored)\n")
-        return
+        out.append("No data to display (all rows were ignored)\n")
+    else:
+        out.append(f"Random Sample ({len(debug_df)} Rows):\n")
+        out.append("-" * 120 + "\n")
 
-    f.write(f"Random Sample ({len(debug_df)} Rows):\n")
-    f.write("-" * 120 + "\n")
+        if report_data['enable_special_code']:
+            write_debug_sample_with_special_code(out, debug_df)
+        else:
+            write_debug_sample_without_special_code(out, debug_df)
 
-    if report_data['enable_special_code']:
-        write_debug_sample_with_special_code(f, debug_df)
-    else:
-        write_debug_sample_without_special_code(f, debug_df)
+        out.append("-" * 120 + "\n")
 
-    f.write("-" * 120 + "\n")
+    return "".join(out)
 
 
-def write_debug_sample_with_special_code(f, debug_df):
+def write_debug_sample(f, report_data):
     """
-    Write debug sample with special code column.
+    Write the debug sample section showing random rows.
 
     Args:
         f: File object
-        debug_df (pd.DataFrame): Debug sample DataFrame
+        report_data (dict): Dictionary containing processed data
     """
-    f.write(f"| {SEQ_NO_COLUMN:<8} | Special Code | Task ID          | Type Coeff | Base Mhrs | Adjusted Mhrs |\n")
-    f.write("-" * 120 + "\n")
+    f.write(build_debug_sample_section(report_data))
+
 
-    for index, row in debug_df.iterrows():
-        seq_no = str(row[SEQ_NO_COLUMN])
-        special_code = str(row.get('Special code', 'N/A')) if pd.notna(row.get('Special code')) else "N/A"
-        special_code = special_code[:12]
-        task_id = str(row['Task ID'])[:16]
-        type_coefficient = row.get('Type Coefficient', 1.0)
-        base_hours = row.get('Base Hours', 0)
-        adjusted_hours = row.get('Adjusted Hours', 0)
-        base_time_hhmm = hours_to_hhmm(base_hours)
-        adjusted_time_hhmm = hours_to_hhmm(adjusted_hours)
+# Row layouts for the debug sample tables; HH:MM columns are converted
+# up front with hours_to_hhmm_series so the row loop only formats strings
+_ROW_FMT_WITH_SPECIAL_CODE = "| {:<8} | {:<12} | {:<16} | {:<10.2f} | {:>9} | {:>13} |\n"
+_ROW_FMT_WITHOUT_SPECIAL_CODE = "| {:<8} | {:<30} | {:<16} | {:<10.2f} | {:>9} | {:>13} |\n"
 
-        f.write(
-            f"| {seq_no:<8} | {special_code:<12} | {task_id:<16} | {type_coefficient:<10.2f} | {base_time_hhmm:>9} | {adjusted_time_hhmm:>13} |\n")
 
+# Defaults for optional debug sample columns, as row.get() used to supply them
+_SAMPLE_DEFAULTS = {'Special code': "N/A", 'Type Coefficient': 1.0, 'Base Hours': 0, 'Adjusted Hours': 0}
+
+
+def _project_sample(debug_df, label_column):
+    """
+    Select the columns a debug sample row shows, ready for itertuples().
 
-def write_debug_sample_without_special_code(f, debug_df):
+    Missing optional columns are added with their default, a blank special
+    code becomes "N/A" and both hours columns are converted to HH:MM.
     """
-    Write debug sample without special code column.
+    columns = [SEQ_NO_COLUMN, label_column, 'Task ID', 'Type Coefficient', 'Base Hours', 'Adjusted Hours']
+    rows = debug_df.reindex(columns=columns)
+    for column, default in _SAMPLE_DEFAULTS.items():
+        if column in rows.columns and column not in debug_df.columns:
+            rows[column] = default
+
+    if label_column == 'Special code':
+        rows[label_column] = rows[label_column].fillna("N/A")
+    rows['Base Hours'] = hours_to_hhmm_series(rows['Base Hours'])
+    rows['Adjusted Hours'] = hours_to_hhmm_series(rows['Adjusted Hours'])
+    return rows
+
+
+def write_debug_sample_with_special_code(out, debug_df):
+    """
+    Append debug sample lines with special code column.
 
     Args:
-        f: File object
+        out (list): Output lines being collected
         debug_df (pd.DataFrame): Debug sample DataFrame
     """
-    f.write(
-        f"| {SEQ_NO_COLUMN:<8} | {TITLE_COLUMN[:30]:<30} | Task ID          | Type Coeff | Base Mhrs | Adjusted Mhrs |\n")
-    f.write("-" * 125 + "\n")
+    out.append(f"| {SEQ_NO_COLUMN:<8} | Special Code | Task ID          | Type Coeff | Base Mhrs | Adjusted Mhrs |\n")
+    out.append("-" * 120 + "\n")
 
-    for index, row in debug_df.iterrows():
-        seq_no = str(row[SEQ_NO_COLUMN])
-        title = str(row[TITLE_COLUMN])[:30]
-        task_id = str(row['Task ID'])[:16]
-        type_coefficient = row.get('Type Coefficient', 1.0)
-        base_hours = row.get('Base Hours', 0)
-        adjusted_hours = row.get('Adjusted Hours', 0)
-        base_time_hhmm = hours_to_hhmm(base_hours)
-        adjusted_time_hhmm = hours_to_hhmm(adjusted_hours)
+    fmt = _ROW_FMT_WITH_SPECIAL_CODE.format
+    out.extend(
+        fmt(str(seq_no), str(special_code)[:12], str(task_id)[:16],
+            type_coefficient, base_hhmm, adjusted_hhmm)
+        for seq_no, special_code, task_id, type_coefficient, base_hhmm, adjusted_hhmm
+        in _project_sample(debug_df, 'Special code').itertuples(index=False, name=None)
+    )
 
-        f.write(
-            f"| {seq_no:<8} | {title:<30} | {task_id:<16} | {type_coefficient:<10.2f} | {base_time_hhmm:>9} | {adjusted_time_hhmm:>13} |\n")
+
+def write_debug_sample_without_special_code(out, debug_df):
+    """
+    Append debug sample lines without special code column.
+
+    Args:
+        out (list): Output lines being collected
+        debug_df (pd.DataFrame): Debug sample DataFrame
+    """
+    out.append(
+        f"| {SEQ_NO_COLUMN:<8} | {TITLE_COLUMN[:30]:<30} | Task ID          | Type Coeff | Base Mhrs | Adjusted Mhrs |\n")
+    out.append("-" * 125 + "\n")
+
+    fmt = _ROW_FMT_WITHOUT_SPECIAL_CODE.format
+    out.extend(
+        fmt(str(seq_no), str(title)[:30], str(task_id)[:16],
+            type_coefficient, base_hhmm, adjusted_hhmm)
+        for seq_no, title, task_id, type_coefficient, base_hhmm, adjusted_hhmm
+        in _project_sample(debug_df, TITLE_COLUMN).itertuples(index=False, name=None)
+    )
 
 
 def create_log_folder_structure(base_filename):
@@ -193,10 +254,6 @@ def create_log_folder_structure(base_filename):
     Returns:
         str: Path to the log folder
     """
-    log_folder = os.path.join(os.getcwd(), 'LOG')
-    os.makedirs(log_folder, exist_ok=True)
-
-    file_log_folder = os.path.join(log_folder, base_filename)
+    file_log_folder = os.path.join(log_root(), base_filename)
     os.makedirs(file_log_folder, exist_ok=True)
-
-    return file_log_folder
\ No newline at end of file
+    return file_log_folder
@@ -4,11 +4,13 @@ Main orchestration for Excel output generation
 UPDATED: Removed separate Special Code Distribution sheet (now integrated into Total Man-Hours Summary)
 """
 
+import io
 import os
-import glob
 import pandas as pd
-from datetime import datetime
 from core.config import INPUT_FOLDER, OUTPUT_FOLDER
+from core.data_loader import iter_input_files
+from utils.excel_utils import EXCEL_WRITE_ENGINE
+from utils.time_utils import now_str
 from .sheet_total_mhrs import create_total_mhrs_sheet
 from .sheet_high_mhrs import create_high_mhrs_sheet
 from .sheet_new_tasks import create_new_task_ids_sheet
@@ -22,7 +24,7 @@ def load_input_files():
     Returns:
         list: List of paths to input Excel files
     """
-    input_files = glob.glob(os.path.join(INPUT_FOLDER, "*.xlsx"))
+    input_files = list(iter_input_files(INPUT_FOLDER))
     if not input_files:
         print(f"No .xlsx files found in the '{INPUT_FOLDER}' folder.")
     return input_files
@@ -45,16 +47,19 @@ def save_output_file(input_file_name, report_data):
     """
     # Create a subfolder for each input file in OUTPUT
     base_filename = os.path.splitext(os.path.basename(input_file_name))[0]
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = now_str("%Y%m%d_%H%M%S")
     output_folder = os.path.join(OUTPUT_FOLDER, base_filename)
     os.makedirs(output_folder, exist_ok=True)
 
     # Define output Excel file path
     output_xlsx_path = os.path.join(output_folder, f"{base_filename}_{timestamp}.xlsx")
 
-    # Create Excel writer with explicit engine
+    # Create Excel writer (xlsxwriter when installed, else openpyxl). The
+    # workbook is built in memory and written out in one go, which avoids
+    # many small writes on slow or network-mounted output folders
     try:
-        with pd.ExcelWriter(output_xlsx_path, engine='openpyxl') as writer:
+        buffer = io.BytesIO()
+        with pd.ExcelWriter(buffer, engine=EXCEL_WRITE_ENGINE) as writer:
             # Sheet 1: Total Man-Hours Summary (now includes special code distribution)
             create_total_mhrs_sheet(writer, report_data)
 
@@ -68,6 +73,9 @@ def save_output_file(input_file_name, report_data):
             if report_data.get('enable_tool_control', False):
                 create_tool_control_sheet(writer, report_data)
 
+        with open(output_xlsx_path, 'wb') as output_file:
+            output_file.write(buffer.getbuffer())
+
         print(f"✓ Excel report saved to {output_xlsx_path}")
 
     except Exception as e:
@@ -0,0 +1,151 @@
+"""
+Sheet Format Module
+Worksheet formatting helpers that work with both the openpyxl and xlsxwriter engines
+"""
+
+import numpy as np
+
+# Background colour of rows with a blank SEQ
+HIGHLIGHT_COLOR = "FFCCCC"
+
+
+def _is_xlsxwriter(writer):
+    """Whether the ExcelWriter is backed by xlsxwriter."""
+    return writer.engine == 'xlsxwriter'
+
+
+def write_message_sheet(writer, sheet_name, message):
+    """
+    Create a sheet holding a single message in cell A1.
+
+    Args:
+        writer: pandas ExcelWriter
+        sheet_name (str): Name of the sheet to create
+        message (str): Text to write
+    """
+    # Written straight through the engine; a one-cell DataFrame would go
+    # through pandas' whole to_excel path for nothing. Both engines list the
+    # new sheet in writer.sheets, which pandas builds from the workbook
+    if _is_xlsxwriter(writer):
+        writer.book.add_worksheet(sheet_name).write(0, 0, message)
+    else:
+        writer.book.create_sheet(sheet_name).append([message])
+
+
+def set_column_widths(writer, sheet_name, widths):
+    """
+    Set column widths, starting from column A.
+
+    Args:
+        writer: pandas ExcelWriter
+        sheet_name (str): Name of the sheet
+        widths (list): Width for each column, in column order
+    """
+    worksheet = writer.sheets[sheet_name]
+
+    if _is_xlsxwriter(writer):
+        for idx, width in enumerate(widths):
+            worksheet.set_column(idx, idx, width)
+    else:
+        for idx, width in enumerate(widths):
+            worksheet.column_dimensions[chr(65 + idx)].width = width
+
+
+def text_lengths(df):
+    """
+    Longest cell text per column, counting the header, as shown in the sheet.
+
+    Args:
+        df (pd.DataFrame): DataFrame that is written to the sheet
+
+    Returns:
+        list: Length of the longest text in each column, in column order
+    """
+    if len(df) == 0:
+        return [len(str(col)) for col in df.columns]
+
+    # One vectorized str.len() per column instead of a Python len() per cell
+    longest = df.fillna('').astype(str).apply(lambda column: column.str.len().max())
+    return [max(int(length), len(str(col))) for col, length in zip(df.columns, longest)]
+
+
+def add_autofilter(writer, sheet_name, first_row, last_row, last_col):
+    """
+    Add an autofilter over columns A..last_col of rows first_row..last_row.
+
+    Args:
+        writer: pandas ExcelWriter
+        sheet_name (str): Name of the sheet
+        first_row (int): First (header) row, 1-based
+        last_row (int): Last row, 1-based
+        last_col (int): Last column, 1-based
+    """
+    worksheet = writer.sheets[sheet_name]
+
+    if _is_xlsxwriter(writer):
+        worksheet.autofilter(first_row - 1, 0, last_row - 1, last_col - 1)
+    else:
+        worksheet.auto_filter.ref = f"A{first_row}:{chr(64 + last_col)}{last_row}"
+
+
+def add_table_autofilter(writer, sheet_name, df):
+    """
+    Add an autofilter over a DataFrame written at A1 with a header row.
+
+    Args:
+        writer: pandas ExcelWriter
+        sheet_name (str): Name of the sheet
+        df (pd.DataFrame): DataFrame that was written to the sheet
+    """
+    add_autofilter(writer, sheet_name, 1, len(df) + 1, len(df.columns))
+
+
+def blank_seq_positions(seq_values, blank_texts=('',)):
+    """
+    Positions of blank SEQ values, found with one vectorized pass.
+
+    Args:
+        seq_values (pd.Series): SEQ column as written to the sheet
+        blank_texts (tuple): Stripped texts that also count as blank
+
+    Returns:
+        np.ndarray: 0-based row positions whose SEQ is missing or blank
+    """
+    blank = seq_values.isna() | seq_values.astype(str).str.strip().isin(blank_texts)
+    return np.flatnonzero(blank.to_numpy())
+
+
+def highlight_rows(writer, sheet_name, df, positions):
+    """
+    Fill the cells of the given DataFrame rows with HIGHLIGHT_COLOR.
+
+    Only the table's own columns are coloured. The DataFrame must have been
+    written at A1 with a header row.
+
+    Args:
+        writer: pandas ExcelWriter
+        sheet_name (str): Name of the sheet
+        df (pd.DataFrame): DataFrame that was written to the sheet
+        positions: Row positions (0-based, within df) to highlight
+    """
+    if len(positions) == 0:
+        return
+
+    worksheet = writer.sheets[sheet_name]
+    num_cols = len(df.columns)
+
+    if _is_xlsxwriter(writer):
+        # xlsxwriter cannot restyle a written cell, so rewrite the row's
+        # values with the fill (blank cells are written as formatted blanks)
+        red_format = writer.book.add_format({'bg_color': f"#{HIGHLIGHT_COLOR}", 'pattern': 1})
+        rows = df.iloc[positions]
+        values = rows.astype(object).where(rows.notna(), '').to_numpy()
+        for pos, row_values in zip(positions, values):
+            worksheet.write_row(int(pos) + 1, 0, row_values.tolist(), red_format)
+    else:
+        from openpyxl.styles import PatternFill
+
+        red_fill = PatternFill(start_color=HIGHLIGHT_COLOR, end_color=HIGHLIGHT_COLOR, fill_type="solid")
+        for pos in positions:
+            for col_idx in range(1, num_cols + 1):
+                worksheet.cell(row=int(pos) + 2, column=col_idx).fill = red_fill
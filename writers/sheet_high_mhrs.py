@@ -4,10 +4,10 @@ FIXED: Removed coefficient columns, only shows Base Hours
 Also adds red highlighting for blank SEQ rows
 """
 
-import pandas as pd
-from openpyxl.styles import PatternFill
-from utils.time_utils import hours_to_hhmm
+from utils.time_utils import hours_to_hhmm_series
 from core.config import SEQ_NO_COLUMN, TITLE_COLUMN
+from .sheet_format import (add_table_autofilter, blank_seq_positions, highlight_rows,
+                           set_column_widths, text_lengths, write_message_sheet)
 
 
 def create_high_mhrs_sheet(writer, report_data):
@@ -18,12 +18,12 @@ def create_high_mhrs_sheet(writer, report_data):
     high_mhrs_df = report_data['high_mhrs_tasks'].copy()
 
     if len(high_mhrs_df) == 0:
-        df = pd.DataFrame([['No tasks found with planned man-hours exceeding the threshold']])
-        df.to_excel(writer, sheet_name='High Man-Hours Tasks', index=False, header=False)
+        write_message_sheet(writer, 'High Man-Hours Tasks',
+                            'No tasks found with planned man-hours exceeding the threshold')
         return
 
     # Add HH:MM formatted column (ONLY Base Hours)
-    high_mhrs_df['Base Mhrs'] = high_mhrs_df['Base Hours'].apply(hours_to_hhmm)
+    high_mhrs_df['Base Mhrs'] = hours_to_hhmm_series(high_mhrs_df['Base Hours'])
 
     # Select and order columns (NO coefficient or adjusted hours)
     columns_to_export = build_export_columns(high_mhrs_df)
@@ -32,15 +32,14 @@ def create_high_mhrs_sheet(writer, report_data):
     # Write to Excel
     export_df.to_excel(writer, sheet_name='High Man-Hours Tasks', index=False)
 
-    # Get the worksheet
-    worksheet = writer.sheets['High Man-Hours Tasks']
-    worksheet.auto_filter.ref = worksheet.dimensions
+    # Filter over the whole table
+    add_table_autofilter(writer, 'High Man-Hours Tasks', export_df)
 
     # Auto-adjust column widths
     adjust_column_widths(writer, 'High Man-Hours Tasks', export_df)
 
     # Add red highlighting for blank SEQ rows
-    highlight_blank_seq_rows(worksheet, export_df)
+    highlight_blank_seq_rows(writer, 'High Man-Hours Tasks', export_df)
 
 
 def build_export_columns(df):
@@ -62,45 +61,23 @@ def build_export_columns(df):
     return columns_to_export
 
 
-def highlight_blank_seq_rows(worksheet, df):
+def highlight_blank_seq_rows(writer, sheet_name, df):
     """
     Add red highlighting to rows with blank SEQ values.
 
     Args:
-        worksheet: openpyxl worksheet object
+        writer: pandas ExcelWriter holding the sheet
+        sheet_name (str): Name of the sheet
         df: DataFrame that was written to the sheet
     """
-    red_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-
-    # Find SEQ column index
-    seq_col_idx = None
-    for idx, col in enumerate(df.columns):
-        if col == SEQ_NO_COLUMN:
-            seq_col_idx = idx
-            break
-
-    if seq_col_idx is None:
+    if SEQ_NO_COLUMN not in df.columns:
         return  # SEQ column not found
 
-    # Check each data row (starting from row 2, after header)
-    for row_idx, (_, row) in enumerate(df.iterrows(), start=2):
-        seq_value = row[SEQ_NO_COLUMN]
-
-        # Check if SEQ is blank/empty
-        if pd.isna(seq_value) or str(seq_value).strip() == '':
-            # Highlight entire row
-            for col_idx in range(1, len(df.columns) + 1):
-                cell = worksheet.cell(row=row_idx, column=col_idx)
-                cell.fill = red_fill
+    # Highlight entire row wherever SEQ is blank/empty
+    highlight_rows(writer, sheet_name, df, blank_seq_positions(df[SEQ_NO_COLUMN]))
 
 
 def adjust_column_widths(writer, sheet_name, df, max_width=50):
     """Auto-adjust column widths."""
-    worksheet = writer.sheets[sheet_name]
-
-    for idx, col in enumerate(df.columns):
-        max_length = max(
-            df[col].fillna('').astype(str).apply(len).max(),
-            len(str(col))
-        )
-        worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, max_width)
\ No newline at end of file
+    widths = [min(length + 2, max_width) for length in text_lengths(df)]
+    set_column_widths(writer, sheet_name, widths)
@@ -5,8 +5,9 @@ FIXED: Red highlighting for blank SEQ rows
 """
 
 import pandas as pd
-from openpyxl.styles import PatternFill
 from core.config import TITLE_COLUMN
+from .sheet_format import (add_table_autofilter, blank_seq_positions, highlight_rows,
+                           set_column_widths, text_lengths, write_message_sheet)
 
 
 def create_new_task_ids_sheet(writer, report_data):
@@ -18,16 +19,14 @@ def create_new_task_ids_sheet(writer, report_data):
     new_task_ids_df = report_data['new_task_ids_with_seq']
 
     if len(new_task_ids_df) == 0:
-        df = pd.DataFrame([['No new task IDs found - all task IDs match reference']])
-        df.to_excel(writer, sheet_name='New Task IDs', index=False, header=False)
+        write_message_sheet(writer, 'New Task IDs', 'No new task IDs found - all task IDs match reference')
         return
 
     # Filter out None / 'nan' Task IDs
     filtered_df = filter_valid_task_ids(new_task_ids_df)
 
     if len(filtered_df) == 0:
-        df = pd.DataFrame([['No new task IDs found - all task IDs match reference']])
-        df.to_excel(writer, sheet_name='New Task IDs', index=False, header=False)
+        write_message_sheet(writer, 'New Task IDs', 'No new task IDs found - all task IDs match reference')
         return
 
     # Build the export DataFrame with consistent columns
@@ -37,11 +36,10 @@ def create_new_task_ids_sheet(writer, report_data):
     export_df.to_excel(writer, sheet_name='New Task IDs', index=False)
 
     # Worksheet formatting
-    worksheet = writer.sheets['New Task IDs']
-    worksheet.auto_filter.ref = worksheet.dimensions
+    add_table_autofilter(writer, 'New Task IDs', export_df)
 
     adjust_column_widths(writer, 'New Task IDs', export_df)
-    highlight_blank_seq_rows(worksheet, export_df)
+    highlight_blank_seq_rows(writer, 'New Task IDs', export_df)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -90,34 +88,23 @@ def filter_valid_task_ids(df):
     ].copy()
 
 
-def highlight_blank_seq_rows(worksheet, df):
+def highlight_blank_seq_rows(writer, sheet_name, df):
     """Add red highlighting to rows where SEQ is blank/empty."""
-    red_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-
-    for row_idx, (_, row) in enumerate(df.iterrows(), start=2):
-        seq_value = row.get('SEQ', '')
-        if pd.isna(seq_value) or str(seq_value).strip() in ('', 'nan'):
-            for col_idx in range(1, len(df.columns) + 1):
-                worksheet.cell(row=row_idx, column=col_idx).fill = red_fill
+    seq_values = df['SEQ'] if 'SEQ' in df.columns else pd.Series('', index=df.index)
+    highlight_rows(writer, sheet_name, df, blank_seq_positions(seq_values, ('', 'nan')))
 
 
 def adjust_column_widths(writer, sheet_name, df):
     """Auto-adjust column widths with sensible maximums."""
-    worksheet = writer.sheets[sheet_name]
-
     max_widths = {
         'SEQ': 20,
         'New Task ID': 35,
         'Description': 80,
     }
 
-    for idx, col in enumerate(df.columns):
-        max_data_len = df[col].fillna('').astype(str).apply(len).max()
-        col_width = min(
-            max(max_data_len, len(str(col))) + 2,
-            max_widths.get(col, 40)
-        )
-        worksheet.column_dimensions[chr(65 + idx)].width = col_width
+    widths = [min(length + 2, max_widths.get(col, 40))
+              for col, length in zip(df.columns, text_lengths(df))]
+    set_column_widths(writer, sheet_name, widths)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
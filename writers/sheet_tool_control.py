@@ -5,7 +5,8 @@ UPDATED: Added percentage column support
 """
 
 import pandas as pd
-from openpyxl.styles import PatternFill
+from .sheet_format import (add_table_autofilter, blank_seq_positions, highlight_rows,
+                           set_column_widths, text_lengths, write_message_sheet)
 
 
 def create_tool_control_sheet(writer, report_data):
@@ -17,60 +18,40 @@ def create_tool_control_sheet(writer, report_data):
     tool_issues_df = report_data.get('tool_control_issues', pd.DataFrame())
 
     if len(tool_issues_df) == 0:
-        df = pd.DataFrame([['All tools and spares have adequate availability (quantity > 0)']])
-        df.to_excel(writer, sheet_name='Tool Control', index=False, header=False)
+        write_message_sheet(writer, 'Tool Control', format_tool_control_message())
         return
 
     # Write to Excel with headers
     tool_issues_df.to_excel(writer, sheet_name='Tool Control', index=False)
 
-    # Get the worksheet
-    worksheet = writer.sheets['Tool Control']
-    worksheet.auto_filter.ref = worksheet.dimensions
+    # Filter over the whole table
+    add_table_autofilter(writer, 'Tool Control', tool_issues_df)
 
     # Auto-adjust column widths
     adjust_column_widths(writer, 'Tool Control', tool_issues_df)
 
     # Add red highlighting for blank SEQ rows
-    highlight_blank_seq_rows(worksheet, tool_issues_df)
+    highlight_blank_seq_rows(writer, 'Tool Control', tool_issues_df)
 
 
-def highlight_blank_seq_rows(worksheet, df):
+def highlight_blank_seq_rows(writer, sheet_name, df):
     """
     Add red highlighting to rows with blank SEQ values.
 
     Args:
-        worksheet: openpyxl worksheet object
+        writer: pandas ExcelWriter holding the sheet
+        sheet_name (str): Name of the sheet
         df: DataFrame that was written to the sheet
     """
-    red_fill = PatternFill(start_color="FFCCCC", end_color="FFCCCC", fill_type="solid")
-
-    # Find SEQ column index
-    seq_col_idx = None
-    for idx, col in enumerate(df.columns):
-        if col == 'SEQ':
-            seq_col_idx = idx
-            break
-
-    if seq_col_idx is None:
+    if 'SEQ' not in df.columns:
         return  # SEQ column not found
 
-    # Check each data row (starting from row 2, after header)
-    for row_idx, (_, row) in enumerate(df.iterrows(), start=2):
-        seq_value = row['SEQ']
-
-        # Check if SEQ is blank/empty
-        if pd.isna(seq_value) or str(seq_value).strip() == '':
-            # Highlight entire row
-            for col_idx in range(1, len(df.columns) + 1):
-                cell = worksheet.cell(row=row_idx, column=col_idx)
-                cell.fill = red_fill
+    # Highlight entire row wherever SEQ is blank/empty
+    highlight_rows(writer, sheet_name, df, blank_seq_positions(df['SEQ']))
 
 
 def adjust_column_widths(writer, sheet_name, df):
     """Auto-adjust column widths for better readability."""
-    worksheet = writer.sheets[sheet_name]
-
     column_max_widths = {
         'Tool/Spare Name': 70,
         'Part Number': 25,
@@ -80,13 +61,9 @@ def adjust_column_widths(writer, sheet_name, df):
         'Percentage': 15
     }
 
-    for idx, col in enumerate(df.columns):
-        max_length = max(
-            df[col].fillna('').astype(str).apply(len).max(),
-            len(str(col))
-        )
-        max_width = column_max_widths.get(col, 20)
-        worksheet.column_dimensions[chr(65 + idx)].width = min(max_length + 2, max_width)
+    widths = [min(length + 2, column_max_widths.get(col, 20))
+              for col, length in zip(df.columns, text_lengths(df))]
+    set_column_widths(writer, sheet_name, widths)
 
 
 def get_tool_control_summary(tool_issues_df):
@@ -7,6 +7,7 @@ import pandas as pd
 import math
 from utils.time_utils import hours_to_hhmm
 from core.config import HOURS_PER_SHIFT
+from .sheet_format import add_autofilter, set_column_widths
 
 
 def format_worker_per_day(avg_hours_per_day, hours_per_shift=8):
@@ -61,16 +62,20 @@ def create_total_mhrs_sheet(writer, report_data):
         else:
             data.append(['Special Code', 'Hours', 'Distribution (%)'])
 
-        special_code_per_day = report_data.get('special_code_per_day', {})
+        # Align per-day averages to the distribution order (NaN where missing)
+        distribution = pd.Series(report_data['special_code_distribution'], dtype=float)
+        special_code_per_day = pd.Series(
+            report_data.get('special_code_per_day') or {}, dtype=float
+        ).reindex(distribution.index)
 
         # Add each special code row
-        for code, hours in report_data['special_code_distribution'].items():
+        for code, hours, avg_per_day in zip(distribution.index, distribution.values,
+                                            special_code_per_day.values):
             code_str = str(code) if pd.notna(code) else "(No Code)"
             percentage = (hours / total_mhrs * 100) if total_mhrs > 0 else 0
             time_str = hours_to_hhmm(hours)
 
-            if workpack_days and code in special_code_per_day:
-                avg_per_day = special_code_per_day[code]
+            if workpack_days and pd.notna(avg_per_day):
                 avg_per_day_str = hours_to_hhmm(avg_per_day)
                 worker_display = format_worker_per_day(avg_per_day, HOURS_PER_SHIFT)
                 data.append([code_str, time_str, avg_per_day_str, worker_display, f"{percentage:.1f}%"])
@@ -90,15 +95,8 @@ def create_total_mhrs_sheet(writer, report_data):
     df = pd.DataFrame(data)
     df.to_excel(writer, sheet_name='Total Man-Hours Summary', index=False, header=False)
 
-    # Format worksheet
-    worksheet = writer.sheets['Total Man-Hours Summary']
-
-    # Adjust column widths
-    worksheet.column_dimensions['A'].width = 25
-    worksheet.column_dimensions['B'].width = 20
-    worksheet.column_dimensions['C'].width = 20
-    worksheet.column_dimensions['D'].width = 20
-    worksheet.column_dimensions['E'].width = 20
+    # Adjust column widths (A-E)
+    set_column_widths(writer, 'Total Man-Hours Summary', [25, 20, 20, 20, 20])
 
     # Add autofilter to the special code table if it exists
     if report_data.get('enable_special_code') and report_data.get('special_code_distribution'):
@@ -112,4 +110,4 @@ def create_total_mhrs_sheet(writer, report_data):
         if table_start_row:
             num_cols = 5 if workpack_days else 3
             table_end_row = len(data)
-            worksheet.auto_filter.ref = f"A{table_start_row}:{chr(64 + num_cols)}{table_end_row}"
\ No newline at end of file
+            add_autofilter(writer, 'Total Man-Hours Summary', table_start_row, table_end_row, num_cols)
\ No newline at end of file